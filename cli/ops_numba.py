@@ -0,0 +1,563 @@
+"""
+Numba-compiled neighborhood kernels for the CVRP solver.
+
+Routes are packed into one contiguous int32 buffer in which every route is
+stored between two depot sentinels:
+
+    buffer       = [0, c11, c12, 0, 0, c21, 0, ...]
+    route_starts = index of the leading depot of each route
+    route_lens   = number of customers of each route
+
+Each kernel scans its whole neighborhood with cost deltas and returns the best
+move as (delta, route_i, route_j, pos_i, pos_j[, seg_len]), where positions are
+0-based customer positions inside the routes. Applying the move is left to the
+caller. The *_neighbors_kernel variants only pair each customer with the
+customers of its k-nearest neighbor list (neighbors[c] = k closest customers).
+Routes are scanned in route_order; with first=True a kernel returns the first
+improving move it meets instead of the best one.
+The distance matrix is float32; deltas are accumulated in float64. If numba is
+not installed, NUMBA_AVAILABLE is False and the solver falls back to its
+pure-Python operators.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+
+    def njit(**options):
+        def decorator(func):
+            try:
+                return numba.njit(**options)(func)
+            except RuntimeError:
+                # cache=True needs the .py source on disk to locate its cache, which frozen
+                # (PyInstaller) builds do not ship: compile those without an on-disk cache
+                return numba.njit(**dict(options, cache=False))(func)
+        return decorator
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Deltas must beat this to count as improvements (float noise otherwise cycles)
+IMPROVEMENT_EPS = 1e-9
+
+
+def pack_routes(customers: np.ndarray, route_starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # From the solution's flat layout (route r = customers[route_starts[r]:route_starts[r+1]])
+    # to the depot-padded buffer: route r's customers shift right by 2r + 1
+    n_routes = len(route_starts) - 1
+    route_lens = np.diff(route_starts).astype(np.int32)
+    padded_starts = (route_starts[:-1] + 2 * np.arange(n_routes)).astype(np.int32)
+    buffer = np.zeros(len(customers) + 2 * n_routes, dtype=np.int32)
+    route_id = np.repeat(np.arange(n_routes), route_lens)
+    buffer[np.arange(len(customers)) + 2 * route_id + 1] = customers
+    return buffer, padded_starts, route_lens
+
+
+def compute_neighbor_lists(distance_matrix: np.ndarray, k: int) -> np.ndarray:
+    # Row c holds the k customers closest to c (depot and c itself excluded)
+    n = distance_matrix.shape[0]
+    k = max(0, min(k, n - 2))
+    D = np.array(distance_matrix, dtype=np.float64)
+    D[:, 0] = np.inf
+    np.fill_diagonal(D, np.inf)
+    return np.ascontiguousarray(np.argsort(D, axis=1, kind='stable')[:, :k], dtype=np.int32)
+
+
+@njit(cache=True)
+def _locate(buffer, route_starts, route_lens, n_nodes):
+    node_route = np.full(n_nodes, -1, dtype=np.int32)
+    node_pos = np.full(n_nodes, -1, dtype=np.int32)
+    for r in range(route_lens.shape[0]):
+        for p in range(route_starts[r] + 1, route_starts[r] + 1 + route_lens[r]):
+            node_route[buffer[p]] = r
+            node_pos[buffer[p]] = p
+    return node_route, node_pos
+
+
+@njit(cache=True, fastmath=True)
+def swap_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, route_order, first):
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = -1
+    n_routes = route_lens.shape[0]
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        for p in range(si + 1, si + 1 + route_lens[i]):
+            prev_i = buffer[p - 1]
+            a = buffer[p]
+            next_i = buffer[p + 1]
+            removed_i = np.float64(D[prev_i, a]) + D[a, next_i]
+            for j in range(i + 1, n_routes):
+                sj = route_starts[j]
+                for q in range(sj + 1, sj + 1 + route_lens[j]):
+                    b = buffer[q]
+                    if loads[i] - demands[a] + demands[b] > capacity or loads[j] - demands[b] + demands[a] > capacity:
+                        continue
+                    prev_j = buffer[q - 1]
+                    next_j = buffer[q + 1]
+                    delta = (np.float64(D[prev_i, b]) + D[b, next_i] + D[prev_j, a] + D[a, next_j]
+                             - removed_i - D[prev_j, b] - D[b, next_j])
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_i = i
+                        best_j = j
+                        best_pi = p - si - 1
+                        best_pj = q - sj - 1
+                        if first and best_delta < -IMPROVEMENT_EPS:
+                            return best_delta, best_i, best_j, best_pi, best_pj
+    return best_delta, best_i, best_j, best_pi, best_pj
+
+
+@njit(cache=True, fastmath=True)
+def swap_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, route_order, first):
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = -1
+    node_route, node_pos = _locate(buffer, route_starts, route_lens, D.shape[0])
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        for p in range(si + 1, si + 1 + route_lens[i]):
+            prev_i = buffer[p - 1]
+            a = buffer[p]
+            next_i = buffer[p + 1]
+            removed_i = np.float64(D[prev_i, a]) + D[a, next_i]
+            for k in range(neighbors.shape[1]):
+                b = neighbors[a, k]
+                j = node_route[b]
+                if j == i or j < 0:
+                    continue
+                if loads[i] - demands[a] + demands[b] > capacity or loads[j] - demands[b] + demands[a] > capacity:
+                    continue
+                q = node_pos[b]
+                prev_j = buffer[q - 1]
+                next_j = buffer[q + 1]
+                delta = (np.float64(D[prev_i, b]) + D[b, next_i] + D[prev_j, a] + D[a, next_j]
+                         - removed_i - D[prev_j, b] - D[b, next_j])
+                if delta < best_delta:
+                    best_delta = delta
+                    best_i = i
+                    best_j = j
+                    best_pi = p - si - 1
+                    best_pj = q - route_starts[j] - 1
+                    if first and best_delta < -IMPROVEMENT_EPS:
+                        return best_delta, best_i, best_j, best_pi, best_pj
+    return best_delta, best_i, best_j, best_pi, best_pj
+
+
+@njit(cache=True, fastmath=True)
+def relocate_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, route_order, first):
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = -1
+    n_routes = route_lens.shape[0]
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        for p in range(si + 1, si + 1 + route_lens[i]):
+            prev_i = buffer[p - 1]
+            customer = buffer[p]
+            next_i = buffer[p + 1]
+            removal_delta = np.float64(D[prev_i, next_i]) - D[prev_i, customer] - D[customer, next_i]
+            for j in range(n_routes):
+                if i == j or loads[j] + demands[customer] > capacity:
+                    continue
+                sj = route_starts[j]
+                for q in range(sj, sj + 1 + route_lens[j]):
+                    u = buffer[q]
+                    v = buffer[q + 1]
+                    delta = removal_delta + D[u, customer] + D[customer, v] - D[u, v]
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_i = i
+                        best_j = j
+                        best_pi = p - si - 1
+                        best_pj = q - sj
+                        if first and best_delta < -IMPROVEMENT_EPS:
+                            return best_delta, best_i, best_j, best_pi, best_pj
+    return best_delta, best_i, best_j, best_pi, best_pj
+
+
+@njit(cache=True, fastmath=True)
+def relocate_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, route_order, first):
+    # A customer is only inserted right before or after one of its neighbors,
+    # or into an empty route
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = -1
+    n_routes = route_lens.shape[0]
+    node_route, node_pos = _locate(buffer, route_starts, route_lens, D.shape[0])
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        for p in range(si + 1, si + 1 + route_lens[i]):
+            prev_i = buffer[p - 1]
+            customer = buffer[p]
+            next_i = buffer[p + 1]
+            removal_delta = np.float64(D[prev_i, next_i]) - D[prev_i, customer] - D[customer, next_i]
+            for k in range(neighbors.shape[1]):
+                b = neighbors[customer, k]
+                j = node_route[b]
+                if j == i or j < 0 or loads[j] + demands[customer] > capacity:
+                    continue
+                q = node_pos[b]
+                for slot in range(q - 1, q + 1):
+                    u = buffer[slot]
+                    v = buffer[slot + 1]
+                    delta = removal_delta + D[u, customer] + D[customer, v] - D[u, v]
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_i = i
+                        best_j = j
+                        best_pi = p - si - 1
+                        best_pj = slot - route_starts[j]
+                        if first and best_delta < -IMPROVEMENT_EPS:
+                            return best_delta, best_i, best_j, best_pi, best_pj
+            for j in range(n_routes):
+                if route_lens[j] > 0 or loads[j] + demands[customer] > capacity:
+                    continue
+                delta = removal_delta + D[0, customer] + D[customer, 0] - D[0, 0]
+                if delta < best_delta:
+                    best_delta = delta
+                    best_i = i
+                    best_j = j
+                    best_pi = p - si - 1
+                    best_pj = 0
+                    if first and best_delta < -IMPROVEMENT_EPS:
+                        return best_delta, best_i, best_j, best_pi, best_pj
+    return best_delta, best_i, best_j, best_pi, best_pj
+
+
+@njit(cache=True, fastmath=True)
+def two_opt_kernel(D, buffer, route_starts, route_lens, route_order, first):
+    best_delta = 0.0
+    best_r = best_pi = best_pj = -1
+    for k_r in range(route_order.shape[0]):
+        r = route_order[k_r]
+        s = route_starts[r]
+        end = s + route_lens[r]
+        # Reversing customers p..q replaces edges (p-1, p) and (q, q+1)
+        for p in range(s + 1, end):
+            a = buffer[p - 1]
+            b = buffer[p]
+            removed = np.float64(D[a, b])
+            for q in range(p + 1, end + 1):
+                c = buffer[q]
+                d = buffer[q + 1]
+                delta = np.float64(D[a, c]) + D[b, d] - removed - D[c, d]
+                if delta < best_delta:
+                    best_delta = delta
+                    best_r = r
+                    best_pi = p - s - 1
+                    best_pj = q - s - 1
+                    if first and best_delta < -IMPROVEMENT_EPS:
+                        return best_delta, best_r, best_r, best_pi, best_pj
+    return best_delta, best_r, best_r, best_pi, best_pj
+
+
+@njit(cache=True, fastmath=True)
+def cross_exchange_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, route_order, first):
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = best_len = -1
+    n_routes = route_lens.shape[0]
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        if route_lens[i] < 2:
+            continue
+        for seg_len in range(1, 3):
+            for p in range(si + 1, si + 2 + route_lens[i] - seg_len):
+                prev_i = buffer[p - 1]
+                first_i = buffer[p]
+                last_i = buffer[p + seg_len - 1]
+                next_i = buffer[p + seg_len]
+                load_seg_i = 0
+                for k in range(p, p + seg_len):
+                    load_seg_i += demands[buffer[k]]
+                removed_i = np.float64(D[prev_i, first_i]) + D[last_i, next_i]
+                for j in range(i + 1, n_routes):
+                    sj = route_starts[j]
+                    if route_lens[j] < 2:
+                        continue
+                    for q in range(sj + 1, sj + 2 + route_lens[j] - seg_len):
+                        prev_j = buffer[q - 1]
+                        first_j = buffer[q]
+                        last_j = buffer[q + seg_len - 1]
+                        next_j = buffer[q + seg_len]
+                        load_seg_j = 0
+                        for k in range(q, q + seg_len):
+                            load_seg_j += demands[buffer[k]]
+                        if loads[i] - load_seg_i + load_seg_j > capacity or loads[j] - load_seg_j + load_seg_i > capacity:
+                            continue
+                        delta = (np.float64(D[prev_i, first_j]) + D[last_j, next_i] + D[prev_j, first_i] + D[last_i, next_j]
+                                 - removed_i - D[prev_j, first_j] - D[last_j, next_j])
+                        if delta < best_delta:
+                            best_delta = delta
+                            best_i = i
+                            best_j = j
+                            best_pi = p - si - 1
+                            best_pj = q - sj - 1
+                            best_len = seg_len
+                            if first and best_delta < -IMPROVEMENT_EPS:
+                                return best_delta, best_i, best_j, best_pi, best_pj, best_len
+    return best_delta, best_i, best_j, best_pi, best_pj, best_len
+
+
+@njit(cache=True, fastmath=True)
+def cross_exchange_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, route_order, first):
+    # Segments are only exchanged when they start at neighboring customers
+    best_delta = 0.0
+    best_i = best_j = best_pi = best_pj = best_len = -1
+    node_route, node_pos = _locate(buffer, route_starts, route_lens, D.shape[0])
+    for k_i in range(route_order.shape[0]):
+        i = route_order[k_i]
+        si = route_starts[i]
+        if route_lens[i] < 2:
+            continue
+        for seg_len in range(1, 3):
+            for p in range(si + 1, si + 2 + route_lens[i] - seg_len):
+                prev_i = buffer[p - 1]
+                first_i = buffer[p]
+                last_i = buffer[p + seg_len - 1]
+                next_i = buffer[p + seg_len]
+                load_seg_i = 0
+                for k in range(p, p + seg_len):
+                    load_seg_i += demands[buffer[k]]
+                removed_i = np.float64(D[prev_i, first_i]) + D[last_i, next_i]
+                for n in range(neighbors.shape[1]):
+                    first_j = neighbors[first_i, n]
+                    j = node_route[first_j]
+                    if j == i or j < 0 or route_lens[j] < 2:
+                        continue
+                    sj = route_starts[j]
+                    q = node_pos[first_j]
+                    if q + seg_len > sj + 1 + route_lens[j]:
+                        continue
+                    prev_j = buffer[q - 1]
+                    last_j = buffer[q + seg_len - 1]
+                    next_j = buffer[q + seg_len]
+                    load_seg_j = 0
+                    for k in range(q, q + seg_len):
+                        load_seg_j += demands[buffer[k]]
+                    if loads[i] - load_seg_i + load_seg_j > capacity or loads[j] - load_seg_j + load_seg_i > capacity:
+                        continue
+                    delta = (np.float64(D[prev_i, first_j]) + D[last_j, next_i] + D[prev_j, first_i] + D[last_i, next_j]
+                             - removed_i - D[prev_j, first_j] - D[last_j, next_j])
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_i = i
+                        best_j = j
+                        best_pi = p - si - 1
+                        best_pj = q - sj - 1
+                        best_len = seg_len
+                        if first and best_delta < -IMPROVEMENT_EPS:
+                            return best_delta, best_i, best_j, best_pi, best_pj, best_len
+    return best_delta, best_i, best_j, best_pi, best_pj, best_len
+
+
+# Simulated annealing with tabu search, one temperature level per call. Moves are
+# applied in place on the padded buffer and tabu moves are kept as int64 keys in a
+# fixed-size ring (a move added at iteration t has expired once tenure_max further
+# moves were added, so the ring never needs more slots than that).
+
+SWAP, RELOCATE, TWO_OPT, CROSS_EXCHANGE = 0, 1, 2, 3
+NEIGHBORHOOD_CODES = {'swap': SWAP, 'relocate': RELOCATE, 'two_opt': TWO_OPT, 'cross_exchange': CROSS_EXCHANGE}
+
+
+def unpack_routes(buffer: np.ndarray, route_lens: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Inverse of pack_routes: customers are the non-depot entries of the buffer
+    route_starts = np.zeros(len(route_lens) + 1, dtype=np.int32)
+    np.cumsum(route_lens, out=route_starts[1:])
+    return buffer[buffer != 0].astype(np.int32), route_starts
+
+
+@njit(cache=True, fastmath=True)
+def acceptance_probability(current_cost, new_cost, temperature):
+    if new_cost < current_cost:
+        return 1.0
+    return np.exp((current_cost - new_cost) / temperature)
+
+
+@njit(cache=True)
+def _find_move(op, D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, use_neighbors,
+               route_order, first):
+    # (delta, route_i, route_j, pos_i, pos_j, seg_len) of the move found by operator `op`
+    if op == SWAP:
+        if use_neighbors:
+            delta, i, j, pi, pj = swap_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                                        neighbors, route_order, first)
+        else:
+            delta, i, j, pi, pj = swap_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                              route_order, first)
+        return delta, i, j, pi, pj, 0
+    if op == RELOCATE:
+        if use_neighbors:
+            delta, i, j, pi, pj = relocate_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                                            neighbors, route_order, first)
+        else:
+            delta, i, j, pi, pj = relocate_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                                  route_order, first)
+        return delta, i, j, pi, pj, 0
+    if op == TWO_OPT:
+        delta, i, j, pi, pj = two_opt_kernel(D, buffer, route_starts, route_lens, route_order, first)
+        return delta, i, j, pi, pj, 0
+    if use_neighbors:
+        return cross_exchange_neighbors_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                               neighbors, route_order, first)
+    return cross_exchange_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, route_order, first)
+
+
+@njit(cache=True)
+def _move_key(op, buffer, route_starts, n_nodes, i, j, pi, pj, seg_len):
+    # Same identity as the solver's move tuples: the customers (and routes) involved
+    a = buffer[route_starts[i] + 1 + pi]
+    if op == RELOCATE:
+        b, c = min(i, j), max(i, j)
+    else:
+        b = buffer[route_starts[j] + 1 + pj]
+        a, b = min(a, b), max(a, b)
+        c = seg_len
+    return op + 4 * (np.int64(a) + n_nodes * (np.int64(b) + n_nodes * np.int64(c)))
+
+
+@njit(cache=True)
+def _apply_move(op, buffer, route_starts, route_lens, loads, demands, i, j, pi, pj, seg_len):
+    if op == SWAP:
+        p = route_starts[i] + 1 + pi
+        q = route_starts[j] + 1 + pj
+        a, b = buffer[p], buffer[q]
+        buffer[p], buffer[q] = b, a
+        loads[i] += demands[b] - demands[a]
+        loads[j] += demands[a] - demands[b]
+    elif op == RELOCATE:
+        # Shift everything between the removal and the insertion point by one slot
+        src = route_starts[i] + 1 + pi
+        dst = route_starts[j] + pj
+        customer = buffer[src]
+        if src < dst:
+            for k in range(src, dst):
+                buffer[k] = buffer[k + 1]
+            buffer[dst] = customer
+            for r in range(i + 1, j + 1):
+                route_starts[r] -= 1
+        else:
+            for k in range(src, dst + 1, -1):
+                buffer[k] = buffer[k - 1]
+            buffer[dst + 1] = customer
+            for r in range(j + 1, i + 1):
+                route_starts[r] += 1
+        route_lens[i] -= 1
+        route_lens[j] += 1
+        loads[i] -= demands[customer]
+        loads[j] += demands[customer]
+    elif op == TWO_OPT:
+        p = route_starts[i] + 1 + pi
+        q = route_starts[i] + 1 + pj
+        while p < q:
+            buffer[p], buffer[q] = buffer[q], buffer[p]
+            p += 1
+            q -= 1
+    else:
+        p = route_starts[i] + 1 + pi
+        q = route_starts[j] + 1 + pj
+        load_change = 0
+        for k in range(seg_len):
+            a, b = buffer[p + k], buffer[q + k]
+            buffer[p + k], buffer[q + k] = b, a
+            load_change += demands[b] - demands[a]
+        loads[i] += load_change
+        loads[j] -= load_change
+
+
+@njit(cache=True)
+def vnd_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, use_neighbors,
+               vnd_order, max_no_improve):
+    # Best-improvement VND in place; returns the total cost delta
+    route_order = np.arange(route_lens.shape[0])
+    total_delta = 0.0
+    k = 0
+    no_improve_count = 0
+    while k < vnd_order.shape[0] and no_improve_count < max_no_improve:
+        op = vnd_order[k]
+        delta, i, j, pi, pj, seg_len = _find_move(op, D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                                  neighbors, use_neighbors, route_order, False)
+        if delta < -IMPROVEMENT_EPS:
+            _apply_move(op, buffer, route_starts, route_lens, loads, demands, i, j, pi, pj, seg_len)
+            total_delta += delta
+            k = 0
+            no_improve_count = 0
+        else:
+            k += 1
+            no_improve_count += 1
+    return total_delta
+
+
+@njit(cache=True)
+def sa_level_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors, use_neighbors,
+                    vnd_order, vnd_max_no_improve, best_buffer, best_starts, best_lens, tabu_keys, tabu_expiry,
+                    state, costs, temperature, n_iterations, tenure, tenure_variation, aspiration,
+                    iter_history, best_history, best_iterations, rng):
+    # state = [total_iterations, no_improve_count, tabu_cursor], costs = [current, best];
+    # both persist across levels. New best costs (and their iteration) are written to
+    # best_history/best_iterations, their count is returned. All random draws come from
+    # rng (a np.random.Generator) in the same order as the pure-Python SA loop.
+    n_nodes = D.shape[0]
+    n_routes = route_lens.shape[0]
+    n_best = 0
+    for _ in range(n_iterations):
+        total_iterations = state[0]
+        if total_iterations % 50 == 0:
+            costs[0] += vnd_kernel(D, buffer, route_starts, route_lens, loads, demands, capacity, neighbors,
+                                   use_neighbors, vnd_order, vnd_max_no_improve)
+            if costs[0] < costs[1]:
+                costs[1] = costs[0]
+                best_buffer[:] = buffer
+                best_starts[:] = route_starts
+                best_lens[:] = route_lens
+                best_history[n_best] = costs[0]
+                best_iterations[n_best] = total_iterations
+                n_best += 1
+                state[1] = 0
+        op = rng.integers(0, 4)
+        delta, i, j, pi, pj, seg_len = _find_move(op, D, buffer, route_starts, route_lens, loads, demands, capacity,
+                                                  neighbors, use_neighbors, rng.permutation(n_routes), True)
+        # A stalled iteration still counts (periodic VND and stopping criteria advance)
+        if delta >= -IMPROVEMENT_EPS:
+            state[1] += 1
+        else:
+            key = _move_key(op, buffer, route_starts, n_nodes, i, j, pi, pj, seg_len)
+            new_cost = costs[0] + delta
+            is_tabu = False
+            for t in range(tabu_keys.shape[0]):
+                if tabu_keys[t] == key and tabu_expiry[t] > total_iterations:
+                    is_tabu = True
+            if not is_tabu or (aspiration and new_cost < costs[1]):
+                if rng.random() < acceptance_probability(costs[0], new_cost, temperature):
+                    _apply_move(op, buffer, route_starts, route_lens, loads, demands, i, j, pi, pj, seg_len)
+                    costs[0] = new_cost
+                    for t in range(tabu_keys.shape[0]):
+                        if tabu_keys[t] == key:
+                            tabu_keys[t] = -1
+                    tabu_keys[state[2]] = key
+                    tabu_expiry[state[2]] = total_iterations + tenure + rng.integers(-tenure_variation, tenure_variation + 1)
+                    state[2] = (state[2] + 1) % tabu_keys.shape[0]
+                    if new_cost < costs[1]:
+                        costs[1] = new_cost
+                        best_buffer[:] = buffer
+                        best_starts[:] = route_starts
+                        best_lens[:] = route_lens
+                        best_history[n_best] = new_cost
+                        best_iterations[n_best] = total_iterations
+                        n_best += 1
+                        state[1] = 0
+                    else:
+                        state[1] += 1
+        state[0] += 1
+        iter_history[state[0]] = costs[0]
+    return n_best
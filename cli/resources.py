@@ -0,0 +1,41 @@
+"""
+Resource paths and instance discovery for the CLI solver and the GUI.
+
+This module only depends on the standard library, so the GUI can list the
+instances of data/ at startup without importing the solver (numba, vrplib,
+matplotlib).
+"""
+
+import os
+import sys
+from typing import List
+
+
+def get_resource_path(rel_path: str) -> str:
+    """Return absolute path to a resource, whether running from source or from a PyInstaller bundle."""
+    if getattr(sys, 'frozen', False):
+        # PyInstaller places data into a temporary folder and sets _MEIPASS
+        base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
+    else:
+        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    return os.path.join(base_path, rel_path) if rel_path else base_path
+
+
+def _scan_vrp_files(directory: str, paths: List[str]) -> None:
+    # scandir entries carry their file type, so no extra stat() per file
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scan_vrp_files(entry.path, paths)
+            elif entry.name.endswith('.vrp'):
+                paths.append(entry.path)
+
+
+def list_instances(data_dir: str = 'data') -> List[str]:
+    paths = []
+    # If a relative directory is passed, resolve against resource path (useful for bundled exe)
+    if not os.path.isabs(data_dir):
+        data_dir = get_resource_path(data_dir)
+    if os.path.exists(data_dir):
+        _scan_vrp_files(data_dir, paths)
+    return sorted(paths)
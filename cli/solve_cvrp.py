@@ -6,21 +6,28 @@ Usage:
   python cli/solve_cvrp.py --instance data/B-n31-k5.vrp
   python cli/solve_cvrp.py --list
   python cli/solve_cvrp.py --instance data/B-n31-k5.vrp --plot
+  python cli/solve_cvrp.py --instance data/B-n31-k5.vrp --plot --no-show
 
 This script provides a CLI to run the algorithm and visualize the final routes and the cost-history.
 """
 
 import argparse
+import hashlib
+import heapq
+import json
 import os
 import random
-import math
 import time
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support, get_context
 from typing import List, Dict, Tuple, Optional
 import yaml
 import sys
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 # Try import vrplib
 try:
@@ -29,15 +36,16 @@ except Exception:
     print("Warning: vrplib not available. Please install vrplib for reading instances.")
     vrplib = None
 
-# Load config.yaml (we expect config.yaml in the repository root)
-def get_resource_path(rel_path: str) -> str:
-    """Return absolute path to a resource, whether running from source or from a PyInstaller bundle."""
-    if getattr(sys, 'frozen', False):
-        # PyInstaller places data into a temporary folder and sets _MEIPASS
-        base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
-    else:
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    return os.path.join(base_path, rel_path) if rel_path else base_path
+# Make the repository root importable when run as a script (python cli/solve_cvrp.py)
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Resource paths and instance listing (dependency-free, shared with the GUI)
+from cli.resources import get_resource_path, list_instances
+
+# Numba kernels for the neighborhood operators (pure-Python fallback if numba is missing)
+from cli import ops_numba
 
 # Load config.yaml (we expect config.yaml in the repository root)
 CONFIG_PATH = get_resource_path('config.yaml')
@@ -49,198 +57,612 @@ np.random.seed(config['general']['random_seed'])
 
 # Data and helper classes
 class CVRPSolution:
-    def __init__(self, routes: List[List[int]], distance_matrix: np.ndarray):
-        self.routes = routes
+    # Routes are stored as flat arrays (structure of arrays):
+    # route r is customers[route_starts[r]:route_starts[r + 1]]
+    def __init__(self, routes: List[List[int]], distance_matrix: np.ndarray, demands: Optional[np.ndarray] = None):
+        lengths = np.fromiter((len(route) for route in routes), dtype=np.int32, count=len(routes))
+        customers = np.fromiter((c for route in routes for c in route), dtype=np.int32, count=int(lengths.sum()))
+        route_starts = np.zeros(len(routes) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=route_starts[1:])
+        self._init_arrays(customers, route_starts, distance_matrix, demands)
+
+    @classmethod
+    def from_arrays(cls, customers: np.ndarray, route_starts: np.ndarray, distance_matrix: np.ndarray,
+                    demands: Optional[np.ndarray] = None) -> 'CVRPSolution':
+        solution = cls.__new__(cls)
+        solution._init_arrays(np.array(customers, dtype=np.int32), np.array(route_starts, dtype=np.int32), distance_matrix, demands)
+        return solution
+
+    def _init_arrays(self, customers: np.ndarray, route_starts: np.ndarray, distance_matrix: np.ndarray,
+                     demands: Optional[np.ndarray]):
+        self.customers = customers
+        self.route_starts = route_starts
         self.distance_matrix = distance_matrix
-        self.cost = self.calculate_cost()
+        self.demands = demands
+        # Per-route loads, kept in lockstep with route mutations by the operators
+        self.loads = self.calculate_loads(demands) if demands is not None else None
+        # Per-route costs, so a move only re-sums the routes it touched
+        self.route_costs = self.calculate_route_costs()
+        self.cost = float(self.route_costs.sum())
+        # Canonical descriptor of the move that produced this solution (used as tabu key)
+        self.move = None
+
+    @property
+    def n_routes(self) -> int:
+        return len(self.route_starts) - 1
+
+    @property
+    def routes(self) -> List[List[int]]:
+        # Nested-list copy of the routes, for display, saving and the pure-Python operators
+        starts = self.route_starts.tolist()
+        return [self.customers[starts[r]:starts[r + 1]].tolist() for r in range(self.n_routes)]
+
+    def iter_route(self, r: int) -> np.ndarray:
+        return self.customers[self.route_starts[r]:self.route_starts[r + 1]]
+
+    def route_cost(self, route: np.ndarray) -> float:
+        if len(route) == 0:
+            return 0.0
+        D = self.distance_matrix
+        return float(D[0, route[0]]) + float(D[route[:-1], route[1:]].sum(dtype=np.float64)) + float(D[route[-1], 0])
+
+    def calculate_route_costs(self) -> np.ndarray:
+        return np.array([self.route_cost(self.iter_route(r)) for r in range(self.n_routes)], dtype=np.float64)
 
     def calculate_cost(self) -> float:
-        total_cost = 0.0
-        for route in self.routes:
-            if len(route) == 0:
-                continue
-            total_cost += self.distance_matrix[0, route[0]]
-            for i in range(len(route) - 1):
-                total_cost += self.distance_matrix[route[i], route[i+1]]
-            total_cost += self.distance_matrix[route[-1], 0]
-        return float(total_cost)
-
-    def update_cost(self):
-        self.cost = self.calculate_cost()
+        return float(self.calculate_route_costs().sum())
+
+    def update_cost(self, touched: Optional[Tuple[int, ...]] = None):
+        if touched is None:
+            self.route_costs = self.calculate_route_costs()
+        else:
+            for r in touched:
+                self.route_costs[r] = self.route_cost(self.iter_route(r))
+        self.cost = float(self.route_costs.sum())
+
+    def calculate_loads(self, demands: np.ndarray) -> np.ndarray:
+        # One reduceat over the customers array; empty routes are skipped as
+        # reduceat would otherwise repeat the next route's first demand for them
+        loads = np.zeros(self.n_routes, dtype=np.int32)
+        non_empty = np.diff(self.route_starts) > 0
+        if non_empty.any():
+            loads[non_empty] = np.add.reduceat(np.asarray(demands)[self.customers], self.route_starts[:-1][non_empty])
+        return loads
 
     def is_feasible(self, demands: np.ndarray, capacity: int) -> bool:
-        for route in self.routes:
-            route_demand = sum(demands[c] for c in route)
-            if route_demand > capacity:
-                return False
-        return True
+        loads = self.loads if self.loads is not None else self.calculate_loads(demands)
+        return bool((loads <= capacity).all())
 
     def copy(self):
-        return CVRPSolution([r.copy() for r in self.routes], self.distance_matrix)
+        new_solution = CVRPSolution.__new__(CVRPSolution)
+        new_solution.customers = self.customers.copy()
+        new_solution.route_starts = self.route_starts.copy()
+        new_solution.distance_matrix = self.distance_matrix
+        new_solution.demands = self.demands
+        new_solution.loads = None if self.loads is None else self.loads.copy()
+        new_solution.route_costs = self.route_costs.copy()
+        new_solution.cost = self.cost
+        new_solution.move = None
+        return new_solution
 
 
 def calculate_distance_matrix(instance: Dict) -> np.ndarray:
+    # Contiguous float32 so the matrix can be handed to the numba kernels as is and
+    # halves the memory traffic of the operator sweeps; costs are summed in float64
     if 'edge_weight' in instance:
-        return instance['edge_weight']
+        return np.ascontiguousarray(instance['edge_weight'], dtype=np.float32)
     elif 'node_coord' in instance:
-        coords = np.array(instance['node_coord'])
-        n = len(coords)
-        dist_matrix = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    dist_matrix[i, j] = math.sqrt(((coords[i] - coords[j])**2).sum())
-        return dist_matrix
+        coords = np.asarray(instance['node_coord'], dtype=np.float64)
+        diff = coords[:, None, :] - coords[None, :, :]
+        return np.ascontiguousarray(np.sqrt((diff * diff).sum(axis=-1)), dtype=np.float32)
     else:
         raise ValueError("Instance must have either 'edge_weight' or 'node_coord'")
 
 
-def nearest_neighbor_solution(instance: Dict, distance_matrix: np.ndarray) -> CVRPSolution:
+def nearest_neighbor_solution(instance: Dict, distance_matrix: np.ndarray, rng: Optional[np.random.Generator] = None) -> CVRPSolution:
+    rng = rng if rng is not None else np.random
     n_customers = instance['dimension'] - 1
     capacity = instance['capacity']
     demands = np.array(instance['demand'])
+    randomness = config['initial_solution'].get('randomness', 0.0)
 
-    unvisited = set(range(1, n_customers + 1))
+    unvisited = np.ones(n_customers + 1, dtype=bool)
+    unvisited[0] = False
     routes = []
 
-    while unvisited:
+    while unvisited.any():
         route = []
         current_load = 0
         current_node = 0
         while True:
-            best_customer = None
-            best_distance = float('inf')
-            for customer in list(unvisited):
-                if current_load + demands[customer] <= capacity:
-                    dist = distance_matrix[current_node, customer]
-                    randomness = config['initial_solution'].get('randomness', 0.0)
-                    dist *= (1 + randomness * random.random())
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_customer = customer
-            if best_customer is None:
+            candidates = np.flatnonzero(unvisited & (demands + current_load <= capacity))
+            if candidates.size == 0:
                 break
+            dist = distance_matrix[current_node, candidates]
+            if randomness:
+                dist = dist * (1 + randomness * rng.random(candidates.size))
+            best_customer = int(candidates[np.argmin(dist)])
             route.append(best_customer)
             current_load += demands[best_customer]
             current_node = best_customer
-            unvisited.remove(best_customer)
+            unvisited[best_customer] = False
         if route:
             routes.append(route)
-    return CVRPSolution(routes, distance_matrix)
+    return CVRPSolution(routes, distance_matrix, demands)
+
+
+def clarke_wright_solution(instance: Dict, distance_matrix: np.ndarray, rng: Optional[np.random.Generator] = None) -> CVRPSolution:
+    # Parallel savings: start from one route per customer and merge routes at their
+    # endpoints by decreasing saving D[0,i] + D[0,j] - D[i,j], as long as capacity allows.
+    # The savings are perturbed by the construction randomness to diversify the starts.
+    rng = rng if rng is not None else np.random
+    n_customers = instance['dimension'] - 1
+    capacity = instance['capacity']
+    demands = np.array(instance['demand'])
+    randomness = config['initial_solution'].get('randomness', 0.0)
+
+    depot_dist = distance_matrix[0, 1:].astype(np.float64)
+    savings = depot_dist[:, None] + depot_dist[None, :] - distance_matrix[1:, 1:]
+    if randomness:
+        savings *= 1 + randomness * rng.random(savings.shape)
+    rows, cols = np.triu_indices(n_customers, 1)
+    pair_savings = savings[rows, cols]
+    order = np.argsort(-pair_savings, kind='stable')
+    order = order[pair_savings[order] > 0]
+
+    routes = {c: [c] for c in range(1, n_customers + 1)}
+    loads = {c: int(demands[c]) for c in range(1, n_customers + 1)}
+    route_of = list(range(n_customers + 1))
+    for i, j in zip((rows[order] + 1).tolist(), (cols[order] + 1).tolist()):
+        ri, rj = route_of[i], route_of[j]
+        if ri == rj or loads[ri] + loads[rj] > capacity:
+            continue
+        route_i, route_j = routes[ri], routes[rj]
+        if route_i[-1] == i and route_j[0] == j:
+            merged = route_i + route_j
+        elif route_i[0] == i and route_j[-1] == j:
+            merged = route_j + route_i
+        elif route_i[-1] == i and route_j[-1] == j:
+            merged = route_i + route_j[::-1]
+        elif route_i[0] == i and route_j[0] == j:
+            merged = route_i[::-1] + route_j
+        else:
+            continue
+        routes[ri] = merged
+        loads[ri] += loads.pop(rj)
+        for c in routes.pop(rj):
+            route_of[c] = ri
+    return CVRPSolution(list(routes.values()), distance_matrix, demands)
+
+
+INITIAL_SOLUTION_METHODS = {
+    'nearest_neighbor': nearest_neighbor_solution,
+    'savings': clarke_wright_solution,
+}
+
+
+# Part of every cache key: bump it whenever a change to the construction code changes its
+# output for the same settings, so entries written by older code are not served
+CACHE_VERSION = 2
+
+
+def _cache_path(kind: str, *key_parts) -> Optional[str]:
+    cache_dir = config['general'].get('cache_dir')
+    if not cache_dir:
+        return None
+    # Relative to the repository root (like config.yaml and data/), not the working directory
+    if not os.path.isabs(cache_dir):
+        cache_dir = get_resource_path(cache_dir)
+    digest = hashlib.sha1(repr(CACHE_VERSION).encode())
+    for part in key_parts:
+        digest.update(np.ascontiguousarray(part).tobytes() if isinstance(part, np.ndarray) else repr(part).encode())
+    return os.path.join(cache_dir, f"{kind}_{digest.hexdigest()}.json")
+
+
+def build_initial_solution(instance: Dict, distance_matrix: np.ndarray, seed: int) -> CVRPSolution:
+    # Construction is deterministic given the instance data, the seed and the construction
+    # settings, so its routes are memoized on disk (general.cache_dir) under a hash of those
+    demands = np.array(instance['demand'])
+    capacity = instance['capacity']
+    method = config['initial_solution'].get('method', 'nearest_neighbor')
+    if method not in INITIAL_SOLUTION_METHODS:
+        raise ValueError(f"Unknown initial solution method: {method}")
+    randomness = config['initial_solution'].get('randomness', 0.0)
+    path = _cache_path('initial', method, randomness, seed, capacity, demands, distance_matrix)
+    # The cache is best-effort: an unreadable or unwritable entry (read-only install,
+    # corrupt JSON) just means building the solution
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                return CVRPSolution(json.load(f), distance_matrix, demands)
+        except (OSError, ValueError):
+            pass
+    solution = INITIAL_SOLUTION_METHODS[method](instance, distance_matrix, np.random.default_rng(seed))
+    if path:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(solution.routes, f)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError):
+            pass
+    return solution
 
 # Neighborhood operators (swap, relocate, 2-opt, cross-exchange)
-def swap_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> Optional[CVRPSolution]:
-    if len(solution.routes) < 2:
+# Moves are scored by their cost delta (only the edges they touch) and the
+# solution is only copied once, for the best move. Routes are padded with depot
+# sentinels so the first/last customer need no special-casing. The distance
+# matrix is assumed symmetric (2-opt reverses segments without re-costing them).
+# The search itself runs in the numba kernels of ops_numba when available.
+IMPROVEMENT_EPS = ops_numba.IMPROVEMENT_EPS
+
+
+def _padded_routes(solution: CVRPSolution) -> List[List[int]]:
+    return [[0] + route + [0] for route in solution.routes]
+
+
+def _route_loads(solution: CVRPSolution, demands: np.ndarray) -> np.ndarray:
+    return solution.loads if solution.loads is not None else solution.calculate_loads(demands)
+
+
+def _working_copy(solution: CVRPSolution, demands: np.ndarray) -> CVRPSolution:
+    # Copy (two flat arrays) with loads attached, so the caller can update them
+    # alongside the customers it moves
+    new_solution = solution.copy()
+    new_solution.demands = demands
+    new_solution.loads = _route_loads(solution, demands).copy()
+    return new_solution
+
+
+def _apply_found(solution: CVRPSolution, demands: np.ndarray, found: Optional[Tuple], apply_move) -> Optional[CVRPSolution]:
+    # Operators return the found move applied to a copy, leaving `solution` untouched
+    if found is None:
         return None
-    best_solution = None
-    best_cost = solution.cost
-    for i in range(len(solution.routes)):
-        for j in range(i + 1, len(solution.routes)):
-            route_i = solution.routes[i]
-            route_j = solution.routes[j]
-            if len(route_i) == 0 or len(route_j) == 0:
-                continue
-            for pos_i in range(len(route_i)):
-                for pos_j in range(len(route_j)):
-                    new_solution = solution.copy()
-                    new_solution.routes[i][pos_i], new_solution.routes[j][pos_j] = new_solution.routes[j][pos_j], new_solution.routes[i][pos_i]
-                    if new_solution.is_feasible(demands, capacity):
-                        new_solution.update_cost()
-                        if new_solution.cost < best_cost:
-                            best_cost = new_solution.cost
-                            best_solution = new_solution
-    return best_solution
-
-
-def relocate_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> Optional[CVRPSolution]:
-    best_solution = None
-    best_cost = solution.cost
-    for i in range(len(solution.routes)):
-        route_i = solution.routes[i]
-        if len(route_i) == 0:
-            continue
-        for pos_i in range(len(route_i)):
-            customer = route_i[pos_i]
-            for j in range(len(solution.routes)):
-                if i == j:
+    new_solution = _working_copy(solution, demands)
+    apply_move(new_solution, demands, found[1])
+    return new_solution
+
+
+def _kernel_args(solution: CVRPSolution, demands: np.ndarray) -> Tuple:
+    demands = np.ascontiguousarray(demands, dtype=np.int32)
+    buffer, route_starts, route_lens = ops_numba.pack_routes(solution.customers, solution.route_starts)
+    loads = np.ascontiguousarray(_route_loads(solution, demands), dtype=np.int32)
+    D = np.ascontiguousarray(solution.distance_matrix, dtype=np.float32)
+    return D, buffer, route_starts, route_lens, loads, demands
+
+
+def _scan_order(n_routes: int, mode: str) -> np.ndarray:
+    # 'best' scans every move; 'first' stops at the first improving one, so routes
+    # are visited in a random order to not always favour the same moves
+    if mode not in ('first', 'best'):
+        raise ValueError(f"Unknown operator mode: {mode}")
+    order = list(range(n_routes))
+    if mode == 'first':
+        random.shuffle(order)
+    return np.array(order, dtype=np.int32)
+
+
+# (float32 matrix, its float64 copy) of the last widened distance matrix
+_float64_cache = (None, None)
+
+
+def _float64_matrix(solution: CVRPSolution) -> np.ndarray:
+    # The pure-Python loops add numpy scalars, so their deltas need a float64 matrix. All the
+    # solutions of a solve share one distance matrix: it is widened once, not per operator call
+    global _float64_cache
+    source, widened = _float64_cache
+    if source is not solution.distance_matrix:
+        widened = solution.distance_matrix.astype(np.float64)
+        _float64_cache = (solution.distance_matrix, widened)
+    return widened
+
+
+def _node_locations(padded: List[List[int]]) -> Dict[int, Tuple[int, int]]:
+    return {c: (r, p) for r, route in enumerate(padded) for p, c in enumerate(route[1:-1], 1)}
+
+
+def _partner_positions(a: int, i: int, padded: List[List[int]], locations: Dict[int, Tuple[int, int]],
+                       neighbors: Optional[np.ndarray]):
+    # (route, padded position) of the customers `a` may be paired with: every customer of
+    # the later routes for a full search, otherwise a's nearest neighbors in other routes
+    if neighbors is None:
+        for j in range(i + 1, len(padded)):
+            for q in range(1, len(padded[j]) - 1):
+                yield j, q
+    else:
+        for b in neighbors[a]:
+            j, q = locations[b]
+            if j != i:
+                yield j, q
+
+
+def _insertion_slots(customer: int, i: int, padded: List[List[int]], locations: Dict[int, Tuple[int, int]],
+                     neighbors: Optional[np.ndarray]):
+    # (route, q) such that `customer` may be inserted between padded[route][q] and padded[route][q+1]
+    if neighbors is None:
+        for j in range(len(padded)):
+            if j != i:
+                for q in range(len(padded[j]) - 1):
+                    yield j, q
+    else:
+        for b in neighbors[customer]:
+            j, q = locations[b]
+            if j != i:
+                yield j, q - 1
+                yield j, q
+        for j in range(len(padded)):
+            if j != i and len(padded[j]) == 2:
+                yield j, 0
+
+
+def _best_swap_move(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                    neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                    order: Optional[np.ndarray] = None) -> Optional[Tuple]:
+    if order is None:
+        order = _scan_order(solution.n_routes, mode)
+    if ops_numba.NUMBA_AVAILABLE:
+        if neighbors is None:
+            delta, i, j, pos_i, pos_j = ops_numba.swap_kernel(*_kernel_args(solution, demands), capacity, order, mode == 'first')
+        else:
+            delta, i, j, pos_i, pos_j = ops_numba.swap_neighbors_kernel(*_kernel_args(solution, demands), capacity, neighbors, order, mode == 'first')
+        return (delta, (i, j, pos_i, pos_j)) if delta < -IMPROVEMENT_EPS else None
+    D = _float64_matrix(solution)
+    padded = _padded_routes(solution)
+    locations = _node_locations(padded) if neighbors is not None else None
+    loads = _route_loads(solution, demands)
+    best_delta = -IMPROVEMENT_EPS
+    best_move = None
+    for i in order:
+        route_i = padded[i]
+        for p in range(1, len(route_i) - 1):
+            prev_i, a, next_i = route_i[p - 1], route_i[p], route_i[p + 1]
+            removed_i = D[prev_i, a] + D[a, next_i]
+            for j, q in _partner_positions(a, i, padded, locations, neighbors):
+                route_j = padded[j]
+                b = route_j[q]
+                if loads[i] - demands[a] + demands[b] > capacity or loads[j] - demands[b] + demands[a] > capacity:
+                    continue
+                prev_j, next_j = route_j[q - 1], route_j[q + 1]
+                delta = (D[prev_i, b] + D[b, next_i] + D[prev_j, a] + D[a, next_j]
+                         - removed_i - D[prev_j, b] - D[b, next_j])
+                if delta < best_delta:
+                    best_delta = delta
+                    best_move = (i, j, p - 1, q - 1)
+                    if mode == 'first':
+                        return best_delta, best_move
+    return (best_delta, best_move) if best_move is not None else None
+
+
+def _apply_swap(solution: CVRPSolution, demands: np.ndarray, move: Tuple):
+    i, j, pos_i, pos_j = move
+    customers = solution.customers
+    k_i, k_j = solution.route_starts[i] + pos_i, solution.route_starts[j] + pos_j
+    a, b = int(customers[k_i]), int(customers[k_j])
+    customers[k_i], customers[k_j] = b, a
+    solution.move = ('swap', min(a, b), max(a, b))
+    solution.loads[i] += demands[b] - demands[a]
+    solution.loads[j] += demands[a] - demands[b]
+    solution.update_cost((i, j))
+
+
+def swap_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                  neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                  order: Optional[np.ndarray] = None) -> Optional[CVRPSolution]:
+    if solution.n_routes < 2:
+        return None
+    return _apply_found(solution, demands, _best_swap_move(solution, demands, capacity, neighbors, mode, order), _apply_swap)
+
+
+def _best_relocate_move(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                        neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                        order: Optional[np.ndarray] = None) -> Optional[Tuple]:
+    if order is None:
+        order = _scan_order(solution.n_routes, mode)
+    if ops_numba.NUMBA_AVAILABLE:
+        if neighbors is None:
+            delta, i, j, pos_i, pos_j = ops_numba.relocate_kernel(*_kernel_args(solution, demands), capacity, order, mode == 'first')
+        else:
+            delta, i, j, pos_i, pos_j = ops_numba.relocate_neighbors_kernel(*_kernel_args(solution, demands), capacity, neighbors, order, mode == 'first')
+        return (delta, (i, j, pos_i, pos_j)) if delta < -IMPROVEMENT_EPS else None
+    D = _float64_matrix(solution)
+    padded = _padded_routes(solution)
+    locations = _node_locations(padded) if neighbors is not None else None
+    loads = _route_loads(solution, demands)
+    best_delta = -IMPROVEMENT_EPS
+    best_move = None
+    for i in order:
+        route_i = padded[i]
+        for p in range(1, len(route_i) - 1):
+            prev_i, customer, next_i = route_i[p - 1], route_i[p], route_i[p + 1]
+            removal_delta = D[prev_i, next_i] - D[prev_i, customer] - D[customer, next_i]
+            for j, q in _insertion_slots(customer, i, padded, locations, neighbors):
+                if loads[j] + demands[customer] > capacity:
                     continue
-                for pos_j in range(len(solution.routes[j]) + 1):
-                    new_solution = solution.copy()
-                    removed = new_solution.routes[i].pop(pos_i)
-                    new_solution.routes[j].insert(pos_j, removed)
-                    if new_solution.is_feasible(demands, capacity):
-                        new_solution.update_cost()
-                        if new_solution.cost < best_cost:
-                            best_cost = new_solution.cost
-                            best_solution = new_solution
-    return best_solution
-
-
-def two_opt_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> Optional[CVRPSolution]:
-    best_solution = None
-    best_cost = solution.cost
-    for route_idx in range(len(solution.routes)):
-        route = solution.routes[route_idx]
+                u, v = padded[j][q], padded[j][q + 1]
+                delta = removal_delta + D[u, customer] + D[customer, v] - D[u, v]
+                if delta < best_delta:
+                    best_delta = delta
+                    best_move = (i, j, p - 1, q)
+                    if mode == 'first':
+                        return best_delta, best_move
+    return (best_delta, best_move) if best_move is not None else None
+
+
+def _apply_relocate(solution: CVRPSolution, demands: np.ndarray, move: Tuple):
+    i, j, pos_i, pos_j = move
+    starts = solution.route_starts
+    k = starts[i] + pos_i
+    removed = int(solution.customers[k])
+    customers = np.delete(solution.customers, k)
+    starts[i + 1:] -= 1
+    solution.customers = np.insert(customers, starts[j] + pos_j, removed)
+    starts[j + 1:] += 1
+    solution.move = ('relocate', removed, min(i, j), max(i, j))
+    solution.loads[i] -= demands[removed]
+    solution.loads[j] += demands[removed]
+    solution.update_cost((i, j))
+
+
+def relocate_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                      neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                      order: Optional[np.ndarray] = None) -> Optional[CVRPSolution]:
+    return _apply_found(solution, demands, _best_relocate_move(solution, demands, capacity, neighbors, mode, order), _apply_relocate)
+
+
+def _best_two_opt_move(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                       neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                       order: Optional[np.ndarray] = None) -> Optional[Tuple]:
+    # Intra-route only, so the neighbor lists are not used
+    if order is None:
+        order = _scan_order(solution.n_routes, mode)
+    if ops_numba.NUMBA_AVAILABLE:
+        D, buffer, route_starts, route_lens, _, _ = _kernel_args(solution, demands)
+        delta, route_idx, _, i, j = ops_numba.two_opt_kernel(D, buffer, route_starts, route_lens, order, mode == 'first')
+        return (delta, (route_idx, i, j)) if delta < -IMPROVEMENT_EPS else None
+    D = solution.distance_matrix
+    best_delta = -IMPROVEMENT_EPS
+    best_move = None
+    for route_idx in order:
+        route = solution.iter_route(route_idx)
         if len(route) < 2:
             continue
-        for i in range(len(route) - 1):
-            for j in range(i + 1, len(route)):
-                new_solution = solution.copy()
-                new_solution.routes[route_idx][i:j+1] = list(reversed(new_solution.routes[route_idx][i:j+1]))
-                new_solution.update_cost()
-                if new_solution.cost < best_cost:
-                    best_cost = new_solution.cost
-                    best_solution = new_solution
-    return best_solution
-
-
-def cross_exchange_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> Optional[CVRPSolution]:
-    if len(solution.routes) < 2:
+        # Reversing the customers between edges x and y (y >= x + 2) of the padded route
+        # replaces (a[x], b[x]) and (a[y], b[y]) with (a[x], a[y]) and (b[x], b[y]):
+        # all the deltas of the route are evaluated at once as an (L+1, L+1) matrix
+        padded = np.concatenate(([0], route, [0]))
+        a, b = padded[:-1], padded[1:]
+        edges = D[a, b].astype(np.float64)
+        delta = D[np.ix_(a, a)].astype(np.float64)
+        delta += D[np.ix_(b, b)]
+        delta -= edges[:, None]
+        delta -= edges[None, :]
+        delta[np.tril_indices(len(a), 1)] = np.inf
+        if mode == 'first':
+            # Same move as the kernel: the first improving one in row-major (x, y) order
+            improving = np.flatnonzero(delta < best_delta)
+            if len(improving):
+                x, y = np.unravel_index(improving[0], delta.shape)
+                return delta[x, y], (route_idx, int(x), int(y) - 1)
+            continue
+        x, y = np.unravel_index(np.argmin(delta), delta.shape)
+        if delta[x, y] < best_delta:
+            best_delta = delta[x, y]
+            best_move = (route_idx, int(x), int(y) - 1)
+    return (best_delta, best_move) if best_move is not None else None
+
+
+def _apply_two_opt(solution: CVRPSolution, demands: np.ndarray, move: Tuple):
+    route_idx, i, j = move
+    route = solution.iter_route(route_idx)
+    route[i:j+1] = route[i:j+1][::-1].copy()
+    a, b = int(route[i]), int(route[j])
+    solution.move = ('two_opt', min(a, b), max(a, b))
+    solution.update_cost((route_idx,))
+
+
+def two_opt_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                     neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                     order: Optional[np.ndarray] = None) -> Optional[CVRPSolution]:
+    return _apply_found(solution, demands, _best_two_opt_move(solution, demands, capacity, neighbors, mode, order), _apply_two_opt)
+
+
+def _best_cross_exchange_move(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                              neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                              order: Optional[np.ndarray] = None) -> Optional[Tuple]:
+    if order is None:
+        order = _scan_order(solution.n_routes, mode)
+    if ops_numba.NUMBA_AVAILABLE:
+        if neighbors is None:
+            delta, i, j, pos_i, pos_j, seg_len = ops_numba.cross_exchange_kernel(*_kernel_args(solution, demands), capacity, order, mode == 'first')
+        else:
+            delta, i, j, pos_i, pos_j, seg_len = ops_numba.cross_exchange_neighbors_kernel(*_kernel_args(solution, demands), capacity, neighbors, order, mode == 'first')
+        return (delta, (i, j, pos_i, pos_j, seg_len)) if delta < -IMPROVEMENT_EPS else None
+    D = _float64_matrix(solution)
+    padded = _padded_routes(solution)
+    locations = _node_locations(padded) if neighbors is not None else None
+    loads = _route_loads(solution, demands)
+    best_delta = -IMPROVEMENT_EPS
+    best_move = None
+    for i in order:
+        route_i = padded[i]
+        if len(route_i) < 4:
+            continue
+        for seg_len in [1, 2]:
+            for p in range(1, len(route_i) - seg_len):
+                prev_i, first_i, last_i, next_i = route_i[p - 1], route_i[p], route_i[p + seg_len - 1], route_i[p + seg_len]
+                load_seg_i = sum(demands[c] for c in route_i[p:p + seg_len])
+                removed_i = D[prev_i, first_i] + D[last_i, next_i]
+                for j, q in _partner_positions(first_i, i, padded, locations, neighbors):
+                    route_j = padded[j]
+                    if len(route_j) < 4 or q + seg_len > len(route_j) - 1:
+                        continue
+                    prev_j, first_j, last_j, next_j = route_j[q - 1], route_j[q], route_j[q + seg_len - 1], route_j[q + seg_len]
+                    load_seg_j = sum(demands[c] for c in route_j[q:q + seg_len])
+                    if loads[i] - load_seg_i + load_seg_j > capacity or loads[j] - load_seg_j + load_seg_i > capacity:
+                        continue
+                    delta = (D[prev_i, first_j] + D[last_j, next_i] + D[prev_j, first_i] + D[last_i, next_j]
+                             - removed_i - D[prev_j, first_j] - D[last_j, next_j])
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_move = (i, j, p - 1, q - 1, seg_len)
+                        if mode == 'first':
+                            return best_delta, best_move
+    return (best_delta, best_move) if best_move is not None else None
+
+
+def _apply_cross_exchange(solution: CVRPSolution, demands: np.ndarray, move: Tuple):
+    i, j, pos_i, pos_j, seg_len = move
+    customers = solution.customers
+    k_i, k_j = solution.route_starts[i] + pos_i, solution.route_starts[j] + pos_j
+    seg_i = customers[k_i:k_i+seg_len].copy()
+    seg_j = customers[k_j:k_j+seg_len].copy()
+    customers[k_i:k_i+seg_len] = seg_j
+    customers[k_j:k_j+seg_len] = seg_i
+    a, b = int(seg_i[0]), int(seg_j[0])
+    solution.move = ('cross_exchange', min(a, b), max(a, b), seg_len)
+    load_change = demands[seg_j].sum() - demands[seg_i].sum()
+    solution.loads[i] += load_change
+    solution.loads[j] -= load_change
+    solution.update_cost((i, j))
+
+
+def cross_exchange_operator(solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                            neighbors: Optional[np.ndarray] = None, mode: str = 'first',
+                            order: Optional[np.ndarray] = None) -> Optional[CVRPSolution]:
+    if solution.n_routes < 2:
         return None
-    best_solution = None
-    best_cost = solution.cost
-    for i in range(len(solution.routes)):
-        for j in range(i + 1, len(solution.routes)):
-            route_i = solution.routes[i]
-            route_j = solution.routes[j]
-            if len(route_i) < 2 or len(route_j) < 2:
-                continue
-            for seg_len in [1, 2]:
-                for pos_i in range(len(route_i) - seg_len + 1):
-                    for pos_j in range(len(route_j) - seg_len + 1):
-                        new_solution = solution.copy()
-                        seg_i = new_solution.routes[i][pos_i:pos_i+seg_len]
-                        seg_j = new_solution.routes[j][pos_j:pos_j+seg_len]
-                        new_solution.routes[i][pos_i:pos_i+seg_len] = seg_j
-                        new_solution.routes[j][pos_j:pos_j+seg_len] = seg_i
-                        if new_solution.is_feasible(demands, capacity):
-                            new_solution.update_cost()
-                            if new_solution.cost < best_cost:
-                                best_cost = new_solution.cost
-                                best_solution = new_solution
-    return best_solution
+    return _apply_found(solution, demands, _best_cross_exchange_move(solution, demands, capacity, neighbors, mode, order),
+                        _apply_cross_exchange)
+
+
+# (find, apply) pair of each neighborhood: the finders return (delta, move) for an
+# improving move or None, the appliers perform a move in place
+NEIGHBORHOODS = {
+    'swap': (_best_swap_move, _apply_swap),
+    'relocate': (_best_relocate_move, _apply_relocate),
+    'two_opt': (_best_two_opt_move, _apply_two_opt),
+    'cross_exchange': (_best_cross_exchange_move, _apply_cross_exchange),
+}
 
 
 # VND
 
-def vnd(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> CVRPSolution:
-    neighborhoods = {
-        'swap': swap_operator,
-        'relocate': relocate_operator,
-        'two_opt': two_opt_operator,
-        'cross_exchange': cross_exchange_operator
-    }
-    neighborhood_order = config['vnd']['neighborhoods']
+def vnd(solution: CVRPSolution, demands: np.ndarray, capacity: int, neighbors: Optional[np.ndarray] = None) -> CVRPSolution:
+    # Moves are searched and applied in place on a single working copy (made on the
+    # first improvement); a found move always has a negative delta, so no cost is compared
+    neighborhoods = [NEIGHBORHOODS[name] for name in config['vnd']['neighborhoods']]
     max_no_improve = config['vnd']['max_iterations_without_improvement']
     current_solution = solution
     k = 0
     no_improve_count = 0
-    while k < len(neighborhood_order) and no_improve_count < max_no_improve:
-        neighborhood_name = neighborhood_order[k]
-        operator = neighborhoods[neighborhood_name]
-        new_solution = operator(current_solution, demands, capacity)
-        if new_solution is not None and new_solution.cost < current_solution.cost:
-            current_solution = new_solution
+    while k < len(neighborhoods) and no_improve_count < max_no_improve:
+        find_move, apply_move = neighborhoods[k]
+        found = find_move(current_solution, demands, capacity, neighbors, 'best')
+        if found is not None:
+            if current_solution is solution:
+                current_solution = _working_copy(solution, demands)
+            apply_move(current_solution, demands, found[1])
             k = 0
             no_improve_count = 0
         else:
@@ -251,34 +673,42 @@ def vnd(solution: CVRPSolution, demands: np.ndarray, capacity: int) -> CVRPSolut
 
 # Tabu list
 class TabuList:
-    def __init__(self, tenure: int):
+    def __init__(self, tenure: int, rng: Optional[np.random.Generator] = None):
         self.tenure = tenure
+        self.rng = rng
         self.tabu_dict = {}
+        # Min-heap of (expiration, seq, move): randomized tenures make expirations
+        # unordered, so expired moves are popped from the heap instead of scanning the dict
+        self.expiry_heap = []
+        self.add_count = 0
         self.current_iteration = 0
 
     def add(self, move: Tuple, tenure_variation: int = 0):
-        actual_tenure = self.tenure + random.randint(-tenure_variation, tenure_variation)
-        self.tabu_dict[move] = self.current_iteration + actual_tenure
+        if self.rng is not None:
+            actual_tenure = self.tenure + int(self.rng.integers(-tenure_variation, tenure_variation + 1))
+        else:
+            actual_tenure = self.tenure + random.randint(-tenure_variation, tenure_variation)
+        expiration = self.current_iteration + actual_tenure
+        self.tabu_dict[move] = expiration
+        self.add_count += 1
+        heapq.heappush(self.expiry_heap, (expiration, self.add_count, move))
 
     def is_tabu(self, move: Tuple) -> bool:
-        if move not in self.tabu_dict:
-            return False
-        return self.tabu_dict[move] > self.current_iteration
+        return self.tabu_dict.get(move, self.current_iteration) > self.current_iteration
 
     def increment_iteration(self):
         self.current_iteration += 1
-        expired = [move for move, expiration in self.tabu_dict.items() if expiration <= self.current_iteration]
-        for move in expired:
-            del self.tabu_dict[move]
-
-
-def acceptance_probability(current_cost: float, new_cost: float, temperature: float) -> float:
-    if new_cost < current_cost:
-        return 1.0
-    return math.exp((current_cost - new_cost) / temperature)
+        while self.expiry_heap and self.expiry_heap[0][0] <= self.current_iteration:
+            expiration, _, move = heapq.heappop(self.expiry_heap)
+            # Skip stale entries of moves re-added with a later expiration
+            if self.tabu_dict.get(move) == expiration:
+                del self.tabu_dict[move]
 
 
-def simulated_annealing_with_tabu(initial_solution: CVRPSolution, demands: np.ndarray, capacity: int, time_limit: float = None) -> Tuple[CVRPSolution, List[float], List[float]]:
+def simulated_annealing_with_tabu(initial_solution: CVRPSolution, demands: np.ndarray, capacity: int, time_limit: float = None,
+                                  neighbors: Optional[np.ndarray] = None) -> Tuple[CVRPSolution, List[float], np.ndarray]:
+    if ops_numba.NUMBA_AVAILABLE:
+        return _simulated_annealing_numba(initial_solution, demands, capacity, time_limit, neighbors)
     temp = config['simulated_annealing']['initial_temperature']
     final_temp = config['simulated_annealing']['final_temperature']
     alpha = config['simulated_annealing']['alpha']
@@ -289,11 +719,17 @@ def simulated_annealing_with_tabu(initial_solution: CVRPSolution, demands: np.nd
     max_iterations = config['local_search']['max_iterations']
     max_no_improve = config['local_search']['max_iterations_without_improvement']
 
+    # One generator for every random draw, consumed in the same order as ops_numba.sa_level_kernel,
+    # so a seed gives the same search with or without numba
+    rng = np.random.default_rng(random.randrange(2 ** 32))
     current_solution = initial_solution
     best_solution = current_solution.copy()
-    tabu_list = TabuList(tabu_tenure)
+    tabu_list = TabuList(tabu_tenure, rng)
     cost_history = [best_solution.cost]  # best-so-far improvement history
-    iter_cost_history = [current_solution.cost]  # cost at each iteration (for convergence plot)
+    # Cost at each iteration (for convergence plot), preallocated: the last temperature
+    # level may run past max_iterations by up to iterations_per_temp iterations
+    iter_cost_history = np.empty(max_iterations + iterations_per_temp + 1, dtype=np.float32)
+    iter_cost_history[0] = current_solution.cost
     no_improve_count = 0
     total_iterations = 0
     start_time = time.time()
@@ -307,21 +743,26 @@ def simulated_annealing_with_tabu(initial_solution: CVRPSolution, demands: np.nd
             break
         for _ in range(iterations_per_temp):
             if total_iterations % 50 == 0:
-                current_solution = vnd(current_solution, demands, capacity)
-
-            operator = random.choice(operators)
-            new_solution = operator(current_solution, demands, capacity)
+                current_solution = vnd(current_solution, demands, capacity, neighbors)
+                if current_solution.cost < best_solution.cost:
+                    best_solution = current_solution.copy()
+                    cost_history.append(best_solution.cost)
+                    no_improve_count = 0
+                    if config['general']['verbose']:
+                        print(f"  Nouveau meilleur : {best_solution.cost:.2f} à l'itération {total_iterations}")
+
+            operator = operators[rng.integers(0, len(operators))]
+            order = rng.permutation(current_solution.n_routes)
+            new_solution = operator(current_solution, demands, capacity, neighbors, mode='first', order=order)
+            # An iteration without an improving move still counts, so the periodic VND and
+            # the stopping criteria advance instead of re-running VND on every stalled draw
             if new_solution is None:
-                continue
-            move_id = (operator.__name__, hash(str(new_solution.routes)))
-            is_tabu = tabu_list.is_tabu(move_id)
-            aspiration = aspiration_enabled and new_solution.cost < best_solution.cost
-            if (not is_tabu or aspiration):
-                if random.random() < acceptance_probability(current_solution.cost, new_solution.cost, temp):
+                no_improve_count += 1
+            elif not tabu_list.is_tabu(new_solution.move) or (aspiration_enabled and new_solution.cost < best_solution.cost):
+                move_id = new_solution.move
+                if rng.random() < ops_numba.acceptance_probability(current_solution.cost, new_solution.cost, temp):
                     current_solution = new_solution
                     tabu_list.add(move_id, tabu_tenure_variation)
-                    # append at acceptance
-                    iter_cost_history.append(current_solution.cost)
                     if current_solution.cost < best_solution.cost:
                         best_solution = current_solution.copy()
                         cost_history.append(best_solution.cost)
@@ -331,12 +772,129 @@ def simulated_annealing_with_tabu(initial_solution: CVRPSolution, demands: np.nd
                     else:
                         no_improve_count += 1
             tabu_list.increment_iteration()
-            # track cost at every iteration (append current solution cost)
-            iter_cost_history.append(current_solution.cost)
             total_iterations += 1
+            iter_cost_history[total_iterations] = current_solution.cost
+        temp *= alpha
+
+    return best_solution, cost_history, iter_cost_history[:total_iterations + 1]
+
+
+def _simulated_annealing_numba(initial_solution: CVRPSolution, demands: np.ndarray, capacity: int, time_limit: float = None,
+                               neighbors: Optional[np.ndarray] = None) -> Tuple[CVRPSolution, List[float], np.ndarray]:
+    # Same search as simulated_annealing_with_tabu, with each temperature level run by
+    # ops_numba.sa_level_kernel on the padded buffer; only the stopping criteria are checked here
+    temp = config['simulated_annealing']['initial_temperature']
+    final_temp = config['simulated_annealing']['final_temperature']
+    alpha = config['simulated_annealing']['alpha']
+    iterations_per_temp = config['simulated_annealing']['iterations_per_temperature']
+    tabu_tenure = config['tabu_search']['tabu_tenure']
+    tabu_tenure_variation = config['tabu_search']['tabu_tenure_random_range']
+    aspiration_enabled = config['tabu_search']['aspiration_enabled']
+    max_iterations = config['local_search']['max_iterations']
+    max_no_improve = config['local_search']['max_iterations_without_improvement']
+    vnd_order = np.array([ops_numba.NEIGHBORHOOD_CODES[name] for name in config['vnd']['neighborhoods']], dtype=np.int64)
+    vnd_max_no_improve = config['vnd']['max_iterations_without_improvement']
+
+    D, buffer, route_starts, route_lens, loads, demands_int32 = _kernel_args(initial_solution, demands)
+    loads = loads.copy()  # may be initial_solution.loads itself, and the kernel updates it in place
+    use_neighbors = neighbors is not None
+    if not use_neighbors:
+        neighbors = np.zeros((0, 0), dtype=np.int32)
+    best_buffer, best_starts, best_lens = buffer.copy(), route_starts.copy(), route_lens.copy()
+    tabu_keys = np.full(max(tabu_tenure + tabu_tenure_variation + 1, 1), -1, dtype=np.int64)
+    tabu_expiry = np.zeros(len(tabu_keys), dtype=np.int64)
+    state = np.zeros(3, dtype=np.int64)  # total_iterations, no_improve_count, tabu ring cursor
+    costs = np.array([initial_solution.cost, initial_solution.cost])  # current, best
+    cost_history = [initial_solution.cost]  # best-so-far improvement history
+    iter_cost_history = np.empty(max_iterations + iterations_per_temp + 1, dtype=np.float32)
+    iter_cost_history[0] = initial_solution.cost
+    # At most one new best per iteration, plus one per periodic VND pass
+    best_history = np.empty(iterations_per_temp + iterations_per_temp // 50 + 1, dtype=np.float64)
+    best_iterations = np.empty(len(best_history), dtype=np.int64)
+    rng = np.random.default_rng(random.randrange(2 ** 32))
+    start_time = time.time()
+
+    while temp > final_temp and state[0] < max_iterations:
+        if time_limit and (time.time() - start_time) > time_limit:
+            break
+        if state[1] >= max_no_improve:
+            break
+        n_best = ops_numba.sa_level_kernel(
+            D, buffer, route_starts, route_lens, loads, demands_int32, capacity, neighbors, use_neighbors,
+            vnd_order, vnd_max_no_improve, best_buffer, best_starts, best_lens, tabu_keys, tabu_expiry,
+            state, costs, temp, iterations_per_temp, tabu_tenure, tabu_tenure_variation, aspiration_enabled,
+            iter_cost_history, best_history, best_iterations, rng)
+        for k in range(n_best):
+            cost_history.append(float(best_history[k]))
+            if config['general']['verbose']:
+                print(f"  Nouveau meilleur : {best_history[k]:.2f} à l'itération {best_iterations[k]}")
         temp *= alpha
 
-    return best_solution, cost_history, iter_cost_history
+    customers, starts = ops_numba.unpack_routes(best_buffer, best_lens)
+    best_solution = CVRPSolution.from_arrays(customers, starts, initial_solution.distance_matrix, demands)
+    return best_solution, cost_history, iter_cost_history[:state[0] + 1]
+
+
+# Parallel multistart: independent SA runs with distinct seeds, best one kept
+
+# Process pools of the multistart runs in progress (see shutdown_workers)
+_active_pools = set()
+
+def _multistart_run(instance: Dict, distance_matrix: np.ndarray, demands: np.ndarray, capacity: int,
+                    time_limit: Optional[float], neighbors: Optional[np.ndarray], seed: int,
+                    verbose: bool) -> Tuple[np.ndarray, np.ndarray, List[float], np.ndarray]:
+    # Runs in a worker process: config and RNG state are process-local
+    random.seed(seed)
+    np.random.seed(seed)
+    config['general']['verbose'] = verbose
+    start_solution = vnd(build_initial_solution(instance, distance_matrix, seed), demands, capacity)
+    best_solution, cost_history, iter_cost_history = simulated_annealing_with_tabu(start_solution, demands, capacity, time_limit, neighbors)
+    return best_solution.customers, best_solution.route_starts, cost_history, iter_cost_history
+
+
+def multistart_simulated_annealing(instance: Dict, start_solution: CVRPSolution, demands: np.ndarray, capacity: int,
+                                   time_limit: Optional[float] = None, neighbors: Optional[np.ndarray] = None,
+                                   n_workers: int = 1) -> Tuple[CVRPSolution, List[float], np.ndarray]:
+    if n_workers <= 1:
+        return simulated_annealing_with_tabu(start_solution, demands, capacity, time_limit, neighbors)
+    # Run 0 continues from start_solution on the calling thread, so its progress is printed
+    # to the caller's stdout; the other runs build their own randomized starts in worker
+    # processes and stay silent. Workers are spawned rather than forked, as the GUI calls
+    # this from a thread with a redirected stdout.
+    seed = config['general']['random_seed']
+    verbose = config['general']['verbose']
+    executor = ProcessPoolExecutor(max_workers=n_workers - 1, mp_context=get_context('spawn'))
+    _active_pools.add(executor)
+    try:
+        futures = [
+            executor.submit(_multistart_run, instance, start_solution.distance_matrix, demands, capacity, time_limit, neighbors,
+                            seed + k, False)
+            for k in range(1, n_workers)
+        ]
+        best_solution, cost_history, iter_cost_history = simulated_annealing_with_tabu(
+            start_solution, demands, capacity, time_limit, neighbors)
+        results = [future.result() for future in futures]
+    finally:
+        _active_pools.discard(executor)
+        executor.shutdown()
+    solutions = [best_solution] + [CVRPSolution.from_arrays(customers, route_starts, start_solution.distance_matrix, demands)
+                                   for customers, route_starts, _, _ in results]
+    histories = [(cost_history, iter_cost_history)] + [(result[2], result[3]) for result in results]
+    best_idx = min(range(n_workers), key=lambda k: solutions[k].cost)
+    if verbose:
+        costs = ', '.join(f"{solution.cost:.2f}" for solution in solutions)
+        print(f"  Coûts des {n_workers} exécutions parallèles : {costs}")
+    return solutions[best_idx], histories[best_idx][0], histories[best_idx][1]
+
+
+def shutdown_workers():
+    # Cancels pending multistart runs and terminates running ones, e.g. when the GUI closes:
+    # otherwise the atexit hook of concurrent.futures waits for every worker to finish
+    for executor in list(_active_pools):
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
 
 
 # Solve function
@@ -358,26 +916,32 @@ def solve_cvrp(instance_path: str, time_limit_override: Optional[float] = None)
     demands = np.array(instance['demand'])
     capacity = instance['capacity']
 
+    # Candidate lists for the moves inside SA; the first VND pass below searches the full neighborhoods
+    neighbor_list_size = config['local_search'].get('neighbor_list_size', 0)
+    neighbors = ops_numba.compute_neighbor_lists(distance_matrix, neighbor_list_size) if neighbor_list_size > 0 else None
+
     print(f"Dimension : {instance['dimension']} nœuds")
     print(f"Capacité : {capacity}\n")
 
     print("Création de la solution initiale...")
-    initial_solution = nearest_neighbor_solution(instance, distance_matrix)
+    initial_solution = build_initial_solution(instance, distance_matrix, config['general']['random_seed'])
     print(f"Coût initial : {initial_solution.cost:.2f}")
-    print(f"Itinéraires initiaux : {len(initial_solution.routes)}\n")
+    print(f"Itinéraires initiaux : {initial_solution.n_routes}\n")
 
     print("Application de VND...")
     improved_solution = vnd(initial_solution, demands, capacity)
     print(f"Coût après VND : {improved_solution.cost:.2f}\n")
 
-    print("Application du Recuit Simulé avec Recherche Tabou...\n")
+    n_workers = config['general'].get('n_workers', 1) or os.cpu_count() or 1
+    print(f"Application du Recuit Simulé avec Recherche Tabou ({n_workers} exécution(s) en parallèle)...\n")
     time_limit = time_limit_override if time_limit_override is not None else config['general'].get('time_limit_seconds')
     start_time = time.time()
-    final_solution, cost_history, iter_cost_history = simulated_annealing_with_tabu(improved_solution, demands, capacity, time_limit)
+    final_solution, cost_history, iter_cost_history = multistart_simulated_annealing(
+        instance, improved_solution, demands, capacity, time_limit, neighbors, n_workers)
     elapsed_time = time.time() - start_time
 
     print(f"Coût final : {final_solution.cost:.2f}")
-    print(f"Itinéraires finaux : {len(final_solution.routes)}")
+    print(f"Itinéraires finaux : {final_solution.n_routes}")
     print(f"Temps écoulé : {elapsed_time:.2f} secondes\n")
 
     optimal_cost = None
@@ -404,7 +968,7 @@ def solve_cvrp(instance_path: str, time_limit_override: Optional[float] = None)
         'cost': final_solution.cost,
         'optimal_cost': optimal_cost,
         'gap_percentage': gap_percentage,
-        'n_routes': len(final_solution.routes),
+        'n_routes': final_solution.n_routes,
         'time_seconds': elapsed_time,
         'cost_history': cost_history,
         'iter_cost_history': iter_cost_history,
@@ -416,11 +980,11 @@ def save_solution(result: Dict, output_dir: str = 'solutions') -> str:
     os.makedirs(output_dir, exist_ok=True)
     instance_name = result['instance_name'].replace('.vrp', '').replace('.txt', '')
     output_path = os.path.join(output_dir, f"{instance_name}_computed.sol")
-    routes = result['solution'].routes
+    solution = result['solution']
     with open(output_path, 'w') as f:
-        for idx, route in enumerate(routes, 1):
-            route_str = ' '.join(map(str, route))
-            f.write(f"Route #{idx}: {route_str}\n")
+        for r in range(solution.n_routes):
+            route_str = ' '.join(map(str, solution.iter_route(r)))
+            f.write(f"Route #{r + 1}: {route_str}\n")
         f.write(f"Cost {result['cost']:.0f}\n")
     print(f"Solution sauvegardée dans : {output_path}")
     return output_path
@@ -428,64 +992,59 @@ def save_solution(result: Dict, output_dir: str = 'solutions') -> str:
 
 # Visualization functions
 
+def _new_figure(figsize: Tuple[float, float], show: bool) -> Figure:
+    # Only figures that are shown go through pyplot; saved-only figures use a bare
+    # Agg canvas, which skips pyplot's figure manager and GUI backend entirely
+    if show:
+        return plt.figure(figsize=figsize)
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _finish_figure(fig: Figure, show: bool, save_path: Optional[str]):
+    if save_path:
+        fig.savefig(save_path, bbox_inches='tight')
+    if show:
+        plt.show()
+
+
 def plot_routes(result: Dict, show: bool = True, save_path: Optional[str] = None):
     instance = result['instance']
-    routes = result['solution'].routes
-    coords = np.array(instance['node_coord'])
+    solution = result['solution']
+    coords = np.asarray(instance['node_coord'])
     depot = coords[0]
 
-    plt.figure(figsize=(8, 8))
-    for idx, route in enumerate(routes):
+    fig = _new_figure((8, 8), show)
+    ax = fig.add_subplot(111)
+    for idx in range(solution.n_routes):
+        route = solution.iter_route(idx)
         if len(route) == 0:
             continue
-        route_coords = [depot] + [coords[c] for c in route] + [depot]
-        xs = [p[0] for p in route_coords]
-        ys = [p[1] for p in route_coords]
-        plt.plot(xs, ys, marker='o', label=f'Route {idx+1}')
-    plt.scatter(depot[0], depot[1], c='k', marker='s', s=80, label='Depot')
-    plt.title(f"Routes - {result['instance_name']} (Cost: {result['cost']:.2f})")
-    plt.legend()
-    plt.axis('equal')
-    if save_path:
-        plt.savefig(save_path, bbox_inches='tight')
-    if show:
-        plt.show()
-    else:
-        plt.close()
+        route_coords = coords[np.concatenate(([0], route, [0]))]
+        ax.plot(route_coords[:, 0], route_coords[:, 1], marker='o', label=f'Route {idx+1}')
+    ax.scatter(depot[0], depot[1], c='k', marker='s', s=80, label='Depot')
+    ax.set_title(f"Routes - {result['instance_name']} (Cost: {result['cost']:.2f})")
+    ax.legend()
+    ax.axis('equal')
+    _finish_figure(fig, show, save_path)
 
 
 def plot_cost_history(result: Dict, show: bool = True, save_path: Optional[str] = None):
-    history = result.get('iter_cost_history') or result.get('cost_history')
-    if not history:
+    history = result.get('iter_cost_history')
+    if history is None or len(history) == 0:
+        history = result.get('cost_history')
+    if history is None or len(history) == 0:
         print('No cost history to plot')
         return
-    plt.figure(figsize=(8, 4))
-    plt.plot(history, marker='o')
-    plt.xlabel('Improvement step')
-    plt.ylabel('Cost')
-    plt.title(f"Cost history - {result['instance_name']}")
-    plt.grid(True)
-    if save_path:
-        plt.savefig(save_path, bbox_inches='tight')
-    if show:
-        plt.show()
-    else:
-        plt.close()
-
-
-# CLI
-
-def list_instances(data_dir: str = 'data') -> List[str]:
-    paths = []
-    # If a relative directory is passed, resolve against resource path (useful for bundled exe)
-    if not os.path.isabs(data_dir):
-        data_dir = get_resource_path(data_dir)
-    if os.path.exists(data_dir):
-        for root, dirs, files in os.walk(data_dir):
-            for f in files:
-                if f.endswith('.vrp'):
-                    paths.append(os.path.join(root, f))
-    return sorted(paths)
+    fig = _new_figure((8, 4), show)
+    ax = fig.add_subplot(111)
+    ax.plot(history, marker='o')
+    ax.set_xlabel('Improvement step')
+    ax.set_ylabel('Cost')
+    ax.set_title(f"Cost history - {result['instance_name']}")
+    ax.grid(True)
+    _finish_figure(fig, show, save_path)
 
 
 # Main
@@ -496,6 +1055,7 @@ def main():
     parser.add_argument('--plot', action='store_true', help='Show plots (routes + cost history)')
     parser.add_argument('--list', action='store_true', help='List available .vrp instances in data/')
     parser.add_argument('--no-save', action='store_true', help='Do not save computed solution')
+    parser.add_argument('--no-show', action='store_true', help='With --plot, only save the plots to plots/')
     args = parser.parse_args()
 
     if args.list:
@@ -528,13 +1088,18 @@ def main():
         save_solution(result)
 
     if args.plot:
+        # Headless runs (no terminal and no backend chosen by the user) only save the plots
+        show = not args.no_show and (os.environ.get('MPLBACKEND') is not None or sys.stdout.isatty())
+        if not show:
+            matplotlib.use('Agg')
         out_dir = 'plots'
         os.makedirs(out_dir, exist_ok=True)
         route_plot = os.path.join(out_dir, f"{result['instance_name']}_routes.png")
         hist_plot = os.path.join(out_dir, f"{result['instance_name']}_cost_history.png")
-        plot_routes(result, save_path=route_plot)
-        plot_cost_history(result, save_path=hist_plot)
+        plot_routes(result, show=show, save_path=route_plot)
+        plot_cost_history(result, show=show, save_path=hist_plot)
 
 
 if __name__ == '__main__':
+    freeze_support()
     main()
@@ -9,17 +9,22 @@ Features:
 - Save computed solution and plots
 """
 
+import asyncio
+import codecs
+import functools
 import os
 import sys
 import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing import freeze_support
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+import numpy as np
 
 # Add repo root or bundled resource base to sys.path so we can import CLI solver
 def get_resource_base():
@@ -31,38 +36,101 @@ ROOT = get_resource_base()
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-# Import the CLI solver functions
-try:
-    from cli.solve_cvrp import list_instances, solve_cvrp, plot_routes, plot_cost_history, save_solution
-except Exception:
-    # If we cannot import, define placeholders
-    list_instances = None
-    def solve_cvrp(instance_path):
-        raise RuntimeError('Cannot import solver. Run pip install -e . or ensure repo root is in PYTHONPATH')
-    def plot_routes(*a, **k):
-        pass
-    def plot_cost_history(*a, **k):
-        pass
-    def save_solution(*a, **k):
-        pass
+# Instance listing only needs the standard library; the CLI solver (numba, vrplib, pyplot) and
+# the embedded Matplotlib figure are imported on first use, so the window paints without
+# waiting for them (see VRPGUI._get_solver/_build_figure)
+from cli.resources import list_instances
+
+
+# Console lines kept in the log widget; older ones are dropped
+MAX_LINES = 5000
+# Pending console text (chars) that is flushed without waiting for the next pump tick
+LOG_FLUSH_SIZE = 65536
+# Cost history points drawn at most (longer histories are decimated)
+MAX_HISTORY_POINTS = 2000
+# Per-iteration cost history points kept in last_result
+MAX_STORED_HISTORY = 5000
+# Clicks on 'Plot' within this delay (ms) share a single refresh
+PLOT_DEBOUNCE_MS = 200
+
+
+def _padded_limits(values: np.ndarray, margin: float = 0.05) -> Tuple[float, float]:
+    lo, hi = float(np.min(values)), float(np.max(values))
+    pad = (hi - lo) * margin or 1.0
+    return lo - pad, hi + pad
+
+
+def _decimate(iterations: np.ndarray, values: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Min and max of each bucket: a bounded point count that keeps the best cost and spikes visible
+    n = len(values)
+    if n <= max_points:
+        return iterations, values
+    bucket = -(-n // (max_points // 2))
+    padded = np.concatenate((values, np.full(-(-n // bucket) * bucket - n, values[-1], dtype=values.dtype)))
+    blocks = padded.reshape(-1, bucket)
+    offsets = np.arange(blocks.shape[0]) * bucket
+    idx = np.unique(np.concatenate((offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1))))
+    return iterations[idx], values[idx]
+
+
+def _dir_mtimes(directory: str) -> Tuple[int, ...]:
+    # Adding or removing a file only bumps the mtime of its own directory, so the
+    # listing is keyed on every directory of the tree (directories only, no per-file stat)
+    mtimes = [os.stat(directory).st_mtime_ns]
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                mtimes.extend(_dir_mtimes(entry.path))
+    return tuple(mtimes)
+
+
+# Bytes read from the stdout pipe per os.read call
+PIPE_READ_SIZE = 65536
 
 
 # Redirect stdout/stderr to Tk Text
 class TextRedirect:
-    def __init__(self, text_widget: ScrolledText):
-        self.text_widget = text_widget
+    # write() may be called from the solver thread: it only buffers the text, and
+    # the Tk main loop drains the buffer periodically (see VRPGUI._pump_log)
+    def __init__(self):
+        self._buf = deque()
+        self._lock = threading.Lock()
+        self.pending = 0
 
     def write(self, s: str):
-        # append text to the widget; schedule on main thread
-        def append():
-            self.text_widget.insert(tk.END, s)
-            self.text_widget.see(tk.END)
-        self.text_widget.after(1, append)
+        with self._lock:
+            self._buf.append(s)
+            self.pending += len(s)
+
+    def drain(self) -> str:
+        with self._lock:
+            chunks = list(self._buf)
+            self._buf.clear()
+            self.pending = 0
+        return ''.join(chunks)
 
     def flush(self):
         pass
 
 
+class DaemonThreadExecutor(Executor):
+    # One daemon thread per job, so closing the window never waits for a running solver
+    # (the threads of the default executor are joined at interpreter exit)
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+
 class VRPGUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -101,15 +169,18 @@ class VRPGUI(tk.Tk):
 
         self.no_save_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(self.left_frame, text='Do not save solution', variable=self.no_save_var).pack(anchor=tk.W, pady=4)
+        self.quiet_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.left_frame, text='Quiet (hide solver output)', variable=self.quiet_var).pack(anchor=tk.W, pady=4)
 
         # Right frame: top area for Matplotlib figures; bottom area for logs
         self.figure_frame = ttk.Frame(self.right_frame)
         self.figure_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.fig, self.ax = plt.subplots(figsize=(6, 6))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.figure_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # The figure is created by the first plot (_build_figure)
+        self.fig = None
+        self._plot_layout = None
+        self._plot_background = None
+        self._pending_plot = None
 
         self.log_frame = ttk.LabelFrame(self.right_frame, text='Console')
         self.log_frame.pack(fill=tk.BOTH, expand=False, pady=8)
@@ -119,52 +190,142 @@ class VRPGUI(tk.Tk):
         # Restore stdout/stderr
         self.old_stdout = sys.stdout
         self.old_stderr = sys.stderr
-        sys.stdout = TextRedirect(self.log_text)
-        sys.stderr = TextRedirect(self.log_text)
+        self.log_redirect = TextRedirect()
+        sys.stdout = self.log_redirect
+        sys.stderr = self.log_redirect
 
         self.last_result = None
-        self.solver_thread = None
+        self._solver = None
+        self._inst_cache = {'dir': None, 'mtime': None, 'paths': None, 'names': None}
+        self._abs_paths = []
+        # Background jobs (solver runs, instance scans) are coroutines on an asyncio loop ticked
+        # from the Tk main loop: the work runs in an executor and widget updates stay on this thread
+        self.loop = asyncio.new_event_loop()
+        self.executor = DaemonThreadExecutor()
+        self.solver_task = None
+        self.refresh_task = None
+        self._stdout_pipe = None
         self.refresh_instances()
+        self._pump_log()
+        self._tick_asyncio()
+
+    def _get_solver(self):
+        # Called from the executor on the first run: importing the solver pulls in numba and pyplot
+        if self._solver is None:
+            try:
+                from cli import solve_cvrp as solver
+            except Exception as e:
+                raise RuntimeError('Cannot import solver. Run pip install -e . or ensure repo root is in PYTHONPATH') from e
+            self._solver = solver
+        return self._solver
+
+    def _build_figure(self):
+        import matplotlib
+        # Embedded canvas only: the figure is built without pyplot, so no global figure manager
+        matplotlib.use('TkAgg')
+        # Coarser simplification and chunked Agg paths for long route polylines / cost histories
+        matplotlib.rcParams['path.simplify'] = True
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
+        matplotlib.rcParams['agg.path.chunksize'] = 10000
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self.fig = Figure(figsize=(6, 6))
+        self.ax_routes, self.ax_cost = self.fig.subplots(1, 2)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.figure_frame)
+        self.canvas_widget = self.canvas.get_tk_widget()
+        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
+
+        # Persistent plot artists, updated in place by plot_selected and blitted
+        self.ax_routes.set_aspect('equal', adjustable='box')
+        self.route_lines = LineCollection([], animated=True)
+        self.ax_routes.add_collection(self.route_lines)
+        self.customer_points = self.ax_routes.scatter([], [], s=16, animated=True)
+        self.depot_point = self.ax_routes.scatter([], [], c='k', marker='s', s=80, animated=True)
+        self.cost_line, = self.ax_cost.plot([], [], animated=True)
+        self.ax_cost.set_xlabel('Iteration')
+        self.ax_cost.set_ylabel('Cost')
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+
+    def _tick_asyncio(self):
+        # Run the callbacks that are ready (e.g. a finished solver job), then yield back to Tk
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        # Bound the size of a single insert when output arrives faster than the pump drains it
+        if self.log_redirect.pending > LOG_FLUSH_SIZE:
+            self._flush_log()
+        self.after(10, self._tick_asyncio)
+
+    def _pump_log(self):
+        self._flush_log()
+        self.after(50, self._pump_log)
+
+    def _flush_log(self):
+        # One insert/see for everything written since the last flush
+        text = self.log_redirect.drain()
+        if text:
+            self.log_text.insert(tk.END, text)
+            n_lines = int(self.log_text.index('end-1c').split('.')[0])
+            if n_lines > MAX_LINES:
+                self.log_text.delete('1.0', f'{n_lines - MAX_LINES + 1}.0')
+            self.log_text.see(tk.END)
 
     def refresh_instances(self):
-        self.instances_listbox.delete(0, tk.END)
+        # The directory scan runs in the executor; only _populate_listbox touches the widget
+        if self.refresh_task and not self.refresh_task.done():
+            return
+        self.refresh_task = self.loop.create_task(self._refresh_job())
+
+    async def _refresh_job(self):
         try:
-            # Use an absolute path to the data directory relative to repo root
-            data_dir = os.path.join(ROOT, 'data')  # ROOT is resource base (handles packaged exe)
-            insts = list_instances(data_dir) if list_instances else []
-            # If list_instances returns absolute paths, show relative ones for readability
-            rel_insts = [os.path.relpath(p, ROOT) for p in insts]
-            insts_to_show = rel_insts
-            # If there are no instances found in the provided directory, try data under repo root as fallback
-            if not insts:
-                # Try the repo relative path
-                fallback_dir = os.path.join(os.getcwd(), 'data')
-                if fallback_dir != data_dir and os.path.exists(fallback_dir):
-                    insts = list_instances(fallback_dir) if list_instances else []
-                    rel_insts = [os.path.relpath(p, ROOT) for p in insts]
-                    insts_to_show = rel_insts
-        
-            if not insts_to_show:
-                self.instances_listbox.insert(tk.END, '(No .vrp instances found in data/)')
-            else:
-                for p in insts_to_show:
-                    self.instances_listbox.insert(tk.END, p)
+            listing = await self.loop.run_in_executor(self.executor, self._scan_instances)
         except Exception as e:
-            messagebox.showerror('Error listing instances', str(e))
+            # Not shown from inside the coroutine: the dialog's nested event loop would tick
+            # the (running) asyncio loop again and stall the stdout pipe reader meanwhile
+            self.after(0, messagebox.showerror, 'Error listing instances', str(e))
+            return
+        self._populate_listbox(listing)
+
+    def _scan_instances(self) -> Tuple[List[str], List[str]]:
+        # Use an absolute path to the data directory relative to repo root
+        data_dir = os.path.join(ROOT, 'data')  # ROOT is resource base (handles packaged exe)
+        paths, names = self._list_instances(data_dir)
+        # If there are no instances found in the provided directory, try data under repo root as fallback
+        if not paths:
+            # Try the repo relative path
+            fallback_dir = os.path.join(os.getcwd(), 'data')
+            if fallback_dir != data_dir and os.path.exists(fallback_dir):
+                paths, names = self._list_instances(fallback_dir)
+        return paths, names
+
+    def _populate_listbox(self, listing: Tuple[List[str], List[str]]):
+        # Absolute paths aligned with the listbox rows; empty while the placeholder is shown
+        self._abs_paths, names = listing
+        self.instances_listbox.delete(0, tk.END)
+        if not names:
+            self.instances_listbox.insert(tk.END, '(No .vrp instances found in data/)')
+        else:
+            self.instances_listbox.insert(tk.END, *names)
+
+    def _list_instances(self, data_dir: str) -> Tuple[List[str], List[str]]:
+        if not os.path.isdir(data_dir):
+            return [], []
+        # Reuse the last listing while no directory of the tree has changed
+        mtime = _dir_mtimes(data_dir)
+        cache = self._inst_cache
+        if cache['dir'] != data_dir or cache['mtime'] != mtime:
+            paths = list_instances(data_dir)
+            # Show paths relative to the repo root for readability
+            names = [os.path.relpath(p, ROOT) for p in paths]
+            self._inst_cache = {'dir': data_dir, 'mtime': mtime, 'paths': paths, 'names': names}
+        return self._inst_cache['paths'], self._inst_cache['names']
 
     def get_selected_instance(self) -> Optional[str]:
         sel = self.instances_listbox.curselection()
-        if not sel:
-            return None
-        entry = self.instances_listbox.get(sel[0])
-        # If the entry is the no-instances placeholder, return None
-        if entry.startswith('(') and 'No .vrp' in entry:
+        if not sel or not self._abs_paths:
             return None
-        # If entry is already absolute, return it
-        if os.path.isabs(entry):
-            return entry
-        # Otherwise, assume it's relative to repo ROOT and return absolute path
-        return os.path.join(ROOT, entry)
+        return self._abs_paths[sel[0]]
 
     def run_selected(self):
         inst = self.get_selected_instance()
@@ -175,7 +336,7 @@ class VRPGUI(tk.Tk):
         if not os.path.exists(inst):
             messagebox.showerror('Instance not found', f"Instance file not found: {inst}")
             return
-        if self.solver_thread and self.solver_thread.is_alive():
+        if self.solver_task and not self.solver_task.done():
             messagebox.showwarning('Solver running', 'A solver is currently running. Please wait')
             return
 
@@ -191,84 +352,199 @@ class VRPGUI(tk.Tk):
 
         # Show the relative path in logs for readability
         rel_path = os.path.relpath(inst, ROOT)
-        self.log_text.insert(tk.END, f"\nStarting solver for {rel_path}...\n")
-        self.log_text.see(tk.END)
+        print(f"\nStarting solver for {rel_path}...")
 
-        def worker():
+        self.solver_task = self.loop.create_task(self._run_job(inst, time_limit))
+
+    async def _run_job(self, inst: str, time_limit: Optional[float]):
+        try:
+            # In quiet mode the solver's stdout goes to devnull instead of the log widget,
+            # otherwise it is captured through an OS pipe where supported
+            # (stderr stays on the log so warnings and errors remain visible)
+            devnull = open(os.devnull, 'w') if self.quiet_var.get() else None
+            if devnull:
+                sys.stdout = devnull
+            else:
+                self._open_stdout_pipe()
             try:
                 # Use CLI solver and pass time_limit override if provided
-                res = solve_cvrp(inst, time_limit_override=time_limit)
-                self.last_result = res
-                # Save based on checkbox
-                if not self.no_save_var.get():
-                    save_solution(res)
-                self.log_text.insert(tk.END, '\nSolver finished.\n')
-            except Exception as e:
-                self.log_text.insert(tk.END, f"Solver error: {e}\n")
+                res = await self.loop.run_in_executor(self.executor, functools.partial(self._solve, inst, time_limit))
+            finally:
+                if devnull:
+                    sys.stdout = self.log_redirect
+                    devnull.close()
+                else:
+                    self._close_stdout_pipe()
+            # The instance is fixed once solved: convert its coordinates once for all plot refreshes
+            if 'node_coord' in res['instance']:
+                res['_coords_np'] = np.asarray(res['instance']['node_coord'], dtype=np.float64)
+            history = res.get('iter_cost_history')
+            if history is not None and len(history) > MAX_STORED_HISTORY:
+                history = np.asarray(history)
+                res['iter_cost_iterations'], res['iter_cost_history'] = _decimate(
+                    np.arange(len(history)), history, MAX_STORED_HISTORY)
+            self.last_result = res
+            # Save based on checkbox
+            if not self.no_save_var.get():
+                self._solver.save_solution(res)
+            print('\nSolver finished.')
+        except Exception as e:
+            print(f"Solver error: {e}")
 
-        self.solver_thread = threading.Thread(target=worker, daemon=True)
-        self.solver_thread.start()
+    def _solve(self, inst: str, time_limit: Optional[float]) -> dict:
+        # Runs in the executor, so a first (slow) solver import does not block the window either
+        return self._get_solver().solve_cvrp(inst, time_limit_override=time_limit)
+
+    def _open_stdout_pipe(self):
+        # Point fd 1 at a pipe read by the asyncio loop: prints become plain write() syscalls
+        # and output of worker processes (multistart) is captured too. The Windows proactor
+        # loop has no add_reader for pipes, so there the solver keeps writing to TextRedirect.
+        if os.name == 'nt':
+            return
+        try:
+            sys.stdout.flush()
+            saved_fd = os.dup(1)
+        except OSError:
+            return
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.dup2(write_fd, 1)
+        os.close(write_fd)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._stdout_pipe = (read_fd, saved_fd, decoder)
+        self.loop.add_reader(read_fd, self._drain_stdout_pipe)
+        sys.stdout = open(1, 'w', encoding='utf-8', buffering=1, closefd=False)
+
+    def _drain_stdout_pipe(self):
+        read_fd, _, decoder = self._stdout_pipe
+        while True:
+            try:
+                data = os.read(read_fd, PIPE_READ_SIZE)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+            self.log_redirect.write(decoder.decode(data))
+
+    def _close_stdout_pipe(self):
+        if self._stdout_pipe is None:
+            return
+        read_fd, saved_fd, decoder = self._stdout_pipe
+        stream, sys.stdout = sys.stdout, self.log_redirect
+        stream.close()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+        # Pick up whatever was written since the last loop tick
+        self._drain_stdout_pipe()
+        self.log_redirect.write(decoder.decode(b'', final=True))
+        self.loop.remove_reader(read_fd)
+        os.close(read_fd)
+        self._stdout_pipe = None
 
     def plot_selected(self):
         if not self.last_result:
             messagebox.showinfo('No solution', 'No computed solution to plot. Run a solver first.')
             return
-        # Clear figure
-        self.fig.clf()
-        # Make a routes plot
+        # Coalesce rapid clicks into one refresh per debounce interval
+        if self._pending_plot is None:
+            self._pending_plot = self.after(PLOT_DEBOUNCE_MS, self._do_plot)
+
+    def _do_plot(self):
+        self._pending_plot = None
         try:
-            # The CLI's plot functions call plt.show(); instead we generate two subplots locally
+            if self.fig is None:
+                self._build_figure()
             inst = self.last_result['instance']
-            routes = self.last_result['solution'].routes
-            coords = inst['node_coord']
-            ax1 = self.fig.add_subplot(121)
-            depot = coords[0]
-            ax1.set_title('Routes')
-            for idx, route in enumerate(routes):
-                if len(route) == 0:
-                    continue
-                route_coords = [depot] + [coords[c] for c in route] + [depot]
-                xs = [p[0] for p in route_coords]
-                ys = [p[1] for p in route_coords]
-                ax1.plot(xs, ys, marker='o', label=f'Route {idx+1}')
-            ax1.scatter(depot[0], depot[1], c='k', marker='s', s=80, label='Depot')
-            ax1.legend(fontsize='small')
-            ax1.axis('equal')
+            solution = self.last_result['solution']
+            coords = self.last_result.get('_coords_np')
+            if coords is None:
+                coords = np.asarray(inst['node_coord'], dtype=np.float64)
+            # All routes in one LineCollection and all customers in one scatter,
+            # colored by route, instead of one Line2D (and legend entry) per route
+            route_lens = np.diff(solution.route_starts)
+            colors = np.array([f'C{idx % 10}' for idx in range(solution.n_routes)])
+            segments = [coords[np.concatenate(([0], solution.iter_route(idx), [0]))]
+                        for idx in range(solution.n_routes) if route_lens[idx] > 0]
+            self.route_lines.set_segments(segments)
+            self.route_lines.set_colors(colors[route_lens > 0])
+            self.customer_points.set_offsets(coords[solution.customers])
+            self.customer_points.set_facecolors(colors[np.repeat(np.arange(solution.n_routes), route_lens)])
+            self.depot_point.set_offsets(coords[:1])
+            layout = [f'Routes ({len(segments)}, depot in black)',
+                      _padded_limits(coords[:, 0]), _padded_limits(coords[:, 1])]
 
             # Cost history
-            ax2 = self.fig.add_subplot(122)
-            history = self.last_result.get('iter_cost_history') or self.last_result.get('cost_history')
-            if history:
-                ax2.plot(history, marker='o')
-                ax2.set_title('Cost history')
-                ax2.set_xlabel('Iteration')
-                ax2.set_ylabel('Cost')
+            history = self.last_result.get('iter_cost_history')
+            iterations = self.last_result.get('iter_cost_iterations')
+            if history is None or len(history) == 0:
+                history = self.last_result.get('cost_history')
+                iterations = None
+            if history is not None and len(history) > 0:
+                history = np.asarray(history)
+                if iterations is None:
+                    iterations = np.arange(len(history))
+                self.cost_line.set_marker('o' if len(history) <= MAX_HISTORY_POINTS else 'None')
+                iterations, history = _decimate(iterations, history, MAX_HISTORY_POINTS)
+                self.cost_line.set_data(iterations, history)
+                layout += ['Cost history', _padded_limits(iterations), _padded_limits(history)]
             else:
-                ax2.text(0.5, 0.5, 'No cost history', ha='center')
-
-            self.canvas.draw()
+                self.cost_line.set_data([], [])
+                layout += ['No cost history', (0.0, 1.0), (0.0, 1.0)]
+
+            if layout == self._plot_layout and self._plot_background is not None:
+                # Same titles and limits: only the data artists are redrawn
+                self.canvas.restore_region(self._plot_background)
+                self._draw_plot_artists()
+                self.canvas.blit(self.fig.bbox)
+            else:
+                # The axes change: full redraw, _on_canvas_draw recaptures the background
+                self._plot_layout = layout
+                routes_title, routes_x, routes_y, cost_title, cost_x, cost_y = layout
+                self.ax_routes.set_title(routes_title)
+                self.ax_routes.set_xlim(*routes_x)
+                self.ax_routes.set_ylim(*routes_y)
+                self.ax_cost.set_title(cost_title)
+                self.ax_cost.set_xlim(*cost_x)
+                self.ax_cost.set_ylim(*cost_y)
+                self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror('Plot error', str(e))
 
+    def _on_canvas_draw(self, event):
+        # The plot artists are animated, so full draws leave them out: capture that
+        # background for blitting, then draw the artists on top
+        self._plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_plot_artists()
+
+    def _draw_plot_artists(self):
+        for artist in (self.route_lines, self.customer_points, self.depot_point, self.cost_line):
+            self.fig.draw_artist(artist)
+
     def save_last_solution(self):
         if not self.last_result:
             messagebox.showinfo('No solution', 'No computed solution to save. Run a solver first.')
             return
         # Save to folder (save_solution already writes to solutions/)
         try:
-            out = save_solution(self.last_result)
+            out = self._get_solver().save_solution(self.last_result)
             messagebox.showinfo('Saved', f'Solution saved to {out}')
         except Exception as e:
             messagebox.showerror('Save error', str(e))
 
     def on_closing(self):
+        # Stop multistart worker processes, their atexit join would keep the process alive
+        if self._solver is not None:
+            self._solver.shutdown_workers()
         # restore stdout
+        self._close_stdout_pipe()
         sys.stdout = self.old_stdout
         sys.stderr = self.old_stderr
+        self.loop.close()
         self.destroy()
 
 
 if __name__ == '__main__':
+    freeze_support()
     app = VRPGUI()
     app.protocol('WM_DELETE_WINDOW', app.on_closing)
     app.mainloop()
@@ -0,0 +1,102 @@
+"""
+Check that the numba kernels and the pure Python fallback of cli/solve_cvrp.py
+agree: every move finder must return the same move in 'first' and 'best' mode,
+with and without neighbor lists, and a seeded SA run must end on the same cost.
+
+Usage: python tools/check_numba.py [instance ...]   (exit code 1 on any mismatch)
+"""
+import os
+import random
+import sys
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from cli import ops_numba
+from cli import solve_cvrp as sc
+
+DEFAULT_INSTANCES = ['P-n16-k8', 'A-n32-k5', 'M-n101-k10', 'X-n101-k25']
+FINDERS = {
+    'swap': sc._best_swap_move,
+    'relocate': sc._best_relocate_move,
+    'two_opt': sc._best_two_opt_move,
+    'cross_exchange': sc._best_cross_exchange_move,
+}
+
+
+def _run(numba: bool, func, *args, **kwargs):
+    ops_numba.NUMBA_AVAILABLE = numba
+    try:
+        return func(*args, **kwargs)
+    finally:
+        ops_numba.NUMBA_AVAILABLE = True
+
+
+def _same_move(a, b) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return abs(a[0] - b[0]) < 1e-4 and tuple(map(int, a[1])) == tuple(map(int, b[1]))
+
+
+def check_finders(name: str, instance, D: np.ndarray, demands: np.ndarray, capacity: int, trials: int = 4) -> int:
+    mismatches = 0
+    for neighbors in (None, ops_numba.compute_neighbor_lists(D, 20)):
+        for t in range(trials):
+            rng = np.random.default_rng(t)
+            solution = sc.nearest_neighbor_solution(instance, D, rng)
+            order = rng.permutation(solution.n_routes)
+            for op, finder in FINDERS.items():
+                for mode in ('first', 'best'):
+                    kernel = _run(True, finder, solution, demands, capacity, neighbors, mode, order)
+                    python = _run(False, finder, solution, demands, capacity, neighbors, mode, order)
+                    if not _same_move(kernel, python):
+                        mismatches += 1
+                        print(f'  {name} {op} mode={mode} neighbors={neighbors is not None} trial={t}: '
+                              f'kernel {kernel} python {python}')
+    return mismatches
+
+
+def check_annealing(name: str, instance, D: np.ndarray, demands: np.ndarray, capacity: int, trials: int = 2) -> int:
+    mismatches = 0
+    for neighbors in (None, ops_numba.compute_neighbor_lists(D, 20)):
+        for t in range(trials):
+            start = sc.nearest_neighbor_solution(instance, D, np.random.default_rng(t))
+            results = []
+            for numba in (True, False):
+                random.seed(100 + t)
+                solution = sc.CVRPSolution([r.copy() for r in start.routes], D, demands)
+                best, _, iterations = _run(numba, sc.simulated_annealing_with_tabu, solution, demands, capacity, 600, neighbors)
+                results.append((best.cost, len(iterations)))
+            if abs(results[0][0] - results[1][0]) > 1e-6 or results[0][1] != results[1][1]:
+                mismatches += 1
+                print(f'  {name} SA neighbors={neighbors is not None} trial={t}: '
+                      f'numba {results[0][0]:.2f}/{results[0][1]} python {results[1][0]:.2f}/{results[1][1]}')
+    return mismatches
+
+
+def main():
+    if not ops_numba.NUMBA_AVAILABLE:
+        print('numba is not installed, nothing to compare')
+        return 0
+    sc.config['general']['verbose'] = False
+    # Shorter SA schedule so the pure Python runs finish quickly
+    sc.config['simulated_annealing']['final_temperature'] = 100.0
+    sc.config['simulated_annealing']['iterations_per_temperature'] = 50
+    total = 0
+    for name in sys.argv[1:] or DEFAULT_INSTANCES:
+        instance = sc.vrplib.read_instance(sc.get_resource_path(os.path.join('data', f'{name}.vrp')))
+        D = sc.calculate_distance_matrix(instance)
+        demands = np.array(instance['demand'])
+        capacity = instance['capacity']
+        mismatches = check_finders(name, instance, D, demands, capacity)
+        mismatches += check_annealing(name, instance, D, demands, capacity)
+        print(f'{name}: {mismatches} mismatches')
+        total += mismatches
+    return 1 if total else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())